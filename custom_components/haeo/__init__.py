@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
-from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.exceptions import ConfigEntryNotReady
 
+from .const import CONF_PARTICIPANTS
 from .coordinator import HaeoDataUpdateCoordinator
 
 if TYPE_CHECKING:
@@ -16,14 +17,14 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: Final[tuple[Platform, ...]] = (Platform.SENSOR,)
 
 type HaeoConfigEntry = ConfigEntry[HaeoDataUpdateCoordinator | None]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: HaeoConfigEntry) -> bool:
     """Set up Home Assistant Energy Optimization from a config entry."""
-    _LOGGER.info("Setting up HAEO integration")
+    _LOGGER.debug("Setting up HAEO integration")
 
     # Store coordinator in runtime data first (required for platform setup)
     coordinator = HaeoDataUpdateCoordinator(hass, entry)
@@ -33,31 +34,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: HaeoConfigEntry) -> bool
     try:
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     except Exception as ex:
-        _LOGGER.exception("Failed to set up HAEO platforms")
-        # Ensure we clean up coordinator on failure so we can retry cleanly
+        _LOGGER.exception("Failed to initialize HAEO integration")
+        # Ensure we clean up coordinator and its solver executor on failure so we can retry cleanly
+        await coordinator.async_shutdown()
         entry.runtime_data = None
         raise ConfigEntryNotReady from ex
 
-    try:
-        # Fetch initial data
-        await coordinator.async_refresh()
-    except Exception as ex:
-        _LOGGER.exception("Failed to initialize HAEO integration")
-        raise ConfigEntryNotReady from ex
+    # Configuration changes from the options flow are applied through async_reload_entry
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
+    # Run the first optimization in the background so it doesn't delay startup, entities populate once it completes
+    entry.async_create_background_task(hass, coordinator.async_refresh(), "haeo_initial_refresh")
 
-    _LOGGER.info("HAEO integration setup complete")
+    _LOGGER.debug("HAEO integration setup complete")
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: HaeoConfigEntry) -> bool:
     """Unload a config entry."""
-    _LOGGER.info("Unloading HAEO integration")
+    _LOGGER.debug("Unloading HAEO integration")
 
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        # Clean up coordinator
+        # Stop the coordinator's refresh timer before dropping it
+        coordinator = entry.runtime_data
+        if coordinator is not None:
+            await coordinator.async_shutdown()
         entry.runtime_data = None
 
     return unload_ok
@@ -65,5 +69,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: HaeoConfigEntry) -> boo
 
 async def async_reload_entry(hass: HomeAssistant, entry: HaeoConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    coordinator = entry.runtime_data
+
+    # Sensors are created per participant, so if those are unchanged the existing entities remain valid
+    if coordinator is not None and coordinator.config.get(CONF_PARTICIPANTS) == entry.data.get(CONF_PARTICIPANTS):
+        coordinator.update_config(entry)
+        await coordinator.async_request_refresh()
+        return
+
+    # Participants changed so entities must be rebuilt, let HA coalesce this with any other pending reload
+    hass.config_entries.async_schedule_reload(entry.entry_id)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+# Imported eagerly as defining the ConfigFlow subclass is what registers the handler for this domain
 from .flows.hub import HubConfigFlow
 
 # Main config flow class for the integration
@@ -31,15 +31,7 @@ ELEMENT_TYPES = [
     ELEMENT_TYPE_NET,
 ]
 # Translation key mapping for element types
-ELEMENT_TYPE_TRANSLATION_KEYS = {
-    ELEMENT_TYPE_BATTERY: "entity.device.battery",
-    ELEMENT_TYPE_GRID: "entity.device.grid",
-    ELEMENT_TYPE_CONSTANT_LOAD: "entity.device.constant_load",
-    ELEMENT_TYPE_FORECAST_LOAD: "entity.device.forecast_load",
-    ELEMENT_TYPE_GENERATOR: "entity.device.generator",
-    ELEMENT_TYPE_NET: "entity.device.net",
-    ELEMENT_TYPE_CONNECTION: "entity.device.connection",
-}
+ELEMENT_TYPE_TRANSLATION_KEYS = {element_type: f"entity.device.{element_type}" for element_type in ELEMENT_TYPES}
 
 
 # Battery configuration keys
@@ -76,7 +68,6 @@ LOAD_TYPE_FORECAST = "forecast"
 CONF_CURTAILMENT = "curtailment"
 CONF_PRICE_PRODUCTION = "price_production"
 CONF_PRICE_CONSUMPTION = "price_consumption"
-CONF_POWER = "power"
 
 # Sensor configuration keys
 CONF_SENSORS = "sensors"
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
 import time
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
-from pulp import value
+import numpy as np
+from pulp import LpVariable
 
 from .const import (
+    ATTR_ENERGY,
     ATTR_POWER,
     CONF_HORIZON_HOURS,
+    CONF_PARTICIPANTS,
     CONF_PERIOD_MINUTES,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
@@ -22,12 +29,15 @@ from .const import (
     OPTIMIZATION_STATUS_SUCCESS,
 )
 from .data_loader import DataLoader
+from .model import Connection
 
 if TYPE_CHECKING:
-    from homeassistant.config_entries import ConfigEntry
+    from collections.abc import Sequence
+
     from homeassistant.core import HomeAssistant
 
-    from .model import Network
+    from . import HaeoConfigEntry
+    from .model import Element, Network
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,10 +59,34 @@ def _calculate_time_parameters(horizon_hours: int, period_minutes: int) -> tuple
     return period_seconds, n_periods
 
 
+@lru_cache(maxsize=8)
+def _period_offsets(period_seconds: int, n_periods: int) -> tuple[timedelta, ...]:
+    """Get the offset of the start of each optimization period from the start of the horizon."""
+    step = timedelta(seconds=period_seconds)
+    return tuple(step * i for i in range(n_periods))
+
+
+def _extract_values(variables: Sequence[LpVariable | float]) -> np.ndarray:
+    """Extract solved values from a series of LP variables and constants, using 0.0 for anything unsolved."""
+    return np.fromiter(
+        ((var.varValue or 0.0) if isinstance(var, LpVariable) else var for var in variables),
+        dtype=np.float64,
+        count=len(variables),
+    )
+
+
+def _same_elements(
+    elements: tuple[Element | Connection, ...],
+    other: tuple[Element | Connection, ...],
+) -> bool:
+    """Check whether two element tuples hold the very same element objects in the same order."""
+    return len(elements) == len(other) and all(a is b for a, b in zip(elements, other, strict=True))
+
+
 class HaeoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Data update coordinator for HAEO integration."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(self, hass: HomeAssistant, entry: HaeoConfigEntry) -> None:
         """Initialize the coordinator."""
         self.hass = hass
         self.entry = entry
@@ -63,41 +97,111 @@ class HaeoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._last_optimization_duration: float | None = None
         self.data_loader = DataLoader(hass)
 
+        # Extracted element values only change when the network is rebuilt or re-solved, so sensors reading them
+        # between updates are served from here
+        self._element_data_cache: dict[str, dict[str, Any] | None] = {}
+        self._timestamps_cache: tuple[tuple[datetime, int, int], list[str]] | None = None
+
+        # Elements making up the network at the last solve, an identical set means the solution can be reused
+        self._solved_elements: tuple[Element | Connection, ...] = ()
+
+        # Solves are long running and CPU bound, so they get their own single worker rather than occupying HA's shared
+        # executor pool. A single worker also guarantees solves for this entry never overlap.
+        self._solver_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{DOMAIN}_solver")
+
+        # Held for a whole update so overlapping refreshes coalesce onto the running one, and so only one update at a
+        # time drives the loader and solver state used on the solver thread (the loader's previous network and element
+        # parameters, and _solved_elements)
+        self._update_lock = asyncio.Lock()
+
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{entry.entry_id}",
             update_interval=timedelta(seconds=DEFAULT_UPDATE_INTERVAL),
+            always_update=False,
         )
 
+    async def async_shutdown(self) -> None:
+        """Shut down the coordinator and its solver executor."""
+        await super().async_shutdown()
+        self._solver_executor.shutdown(wait=False)
+
+    @callback
+    def update_config(self, entry: HaeoConfigEntry) -> None:
+        """Update the coordinator with a changed configuration entry."""
+        self.entry = entry
+        self.config = entry.data
+
     def get_future_timestamps(self) -> list[str]:
         """Get list of ISO timestamps for each optimization period."""
         if not self.optimization_result or not self.network:
             return []
 
         start_time = self.optimization_result["timestamp"]
-        timestamps = []
 
-        for i in range(self.network.n_periods):
-            period_time = start_time + timedelta(seconds=self.network.period * i)
-            timestamps.append(period_time.isoformat())
+        # The timestamps only depend on when the last solve ran and the network timing, so reuse them until either moves
+        key = (start_time, self.network.period, self.network.n_periods)
+        if self._timestamps_cache is not None and self._timestamps_cache[0] == key:
+            return self._timestamps_cache[1]
 
+        offsets = _period_offsets(self.network.period, self.network.n_periods)
+        timestamps = [(start_time + offset).isoformat() for offset in offsets]
+
+        self._timestamps_cache = (key, timestamps)
         return timestamps
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data from Home Assistant entities and run optimization."""
+        # Coalesce with an update that is already running rather than queueing another solve behind it
+        if self._update_lock.locked() and self.data is not None:
+            _LOGGER.debug("Optimization already in progress, keeping the current result")
+            return self.data
+
+        async with self._update_lock:
+            return await self._async_optimize()
+
+    async def _async_optimize(self) -> dict[str, Any]:
+        """Load the network from Home Assistant entities and solve it."""
+        # Read the clock once, every result of this update is stamped with the time its inputs were read
+        now = dt_util.utcnow()
+
+        # Read the configuration from the entry itself, which holds the latest data even before the update listener
+        # has passed it on, so the snapshot and the network are taken from the same participants
+        config = self.entry.data
+        participants = config.get(CONF_PARTICIPANTS)
+
+        # A new hub has no participants until some are added, so there is nothing to load or solve
+        if not participants:
+            _LOGGER.debug("No participants configured, skipping optimization")
+            return {"cost": None, "timestamp": now, "duration": None}
+
         # Start timing the entire optimization process
         start_time = time.time()
 
         try:
             # Calculate time parameters from configuration
             period_seconds, n_periods = _calculate_time_parameters(
-                self.config[CONF_HORIZON_HOURS],
-                self.config[CONF_PERIOD_MINUTES],
+                config[CONF_HORIZON_HOURS],
+                config[CONF_PERIOD_MINUTES],
+            )
+
+            # Read sensor states on the event loop, then build the network from that snapshot on the solver thread
+            # (includes sensor availability check)
+            states = self.data_loader.snapshot_states(participants)
+            network = await self.hass.loop.run_in_executor(
+                self._solver_executor,
+                self.data_loader.load_network_data,
+                self.entry,
+                period_seconds,
+                n_periods,
+                states,
+                participants,
             )
 
-            # Create new network with current sensor data (includes sensor availability check)
-            self.network = await self.data_loader.load_network_data(self.entry, period_seconds, n_periods)
+            # The network is built as a new object, so sensors keep reading the previous one until it has fully loaded
+            self.network = network
+            self._element_data_cache.clear()
 
             # Check if sensor data is available
             if not self.network.sensor_data_available:
@@ -106,11 +210,19 @@ class HaeoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 # Don't raise UpdateFailed here - let the sensors show as unavailable
                 end_time = time.time()
                 self._last_optimization_duration = end_time - start_time
-                return {"cost": None, "timestamp": dt_util.utcnow(), "duration": self.last_optimization_duration}
-
-            # Run optimization in executor job to avoid blocking the event loop
-            _LOGGER.debug("Running optimization for network with %d elements", len(self.network.elements))
-            cost = await self.hass.async_add_executor_job(self.network.optimize)
+                return {"cost": None, "timestamp": now, "duration": self.last_optimization_duration}
+
+            elements = tuple(self.network.elements.values())
+            if self.optimization_result is not None and _same_elements(elements, self._solved_elements):
+                # Every element was reused from the last solve as its inputs are unchanged, so its solution still holds
+                _LOGGER.debug("Network unchanged since the last optimization, reusing its solution")
+                cost = self.optimization_result["cost"]
+            else:
+                # Run optimization on the solver executor to avoid blocking the event loop
+                _LOGGER.debug("Running optimization for network with %d elements", len(elements))
+                cost = await self.hass.loop.run_in_executor(self._solver_executor, self.network.optimize)
+                self._solved_elements = elements
+                self._element_data_cache.clear()
 
             # End timing after successful optimization
             end_time = time.time()
@@ -118,7 +230,7 @@ class HaeoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
             self.optimization_result = {
                 "cost": cost,
-                "timestamp": dt_util.utcnow(),
+                "timestamp": now,
                 "duration": self.last_optimization_duration,
             }
             self.optimization_status = OPTIMIZATION_STATUS_SUCCESS
@@ -138,43 +250,53 @@ class HaeoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self.optimization_status = OPTIMIZATION_STATUS_FAILED
             _LOGGER.exception("Unhandled exception in HAEO update loop - optimisation marked failed")
             self.optimization_result = None
-            return {"cost": None, "timestamp": dt_util.utcnow(), "duration": self.last_optimization_duration}
+            return {"cost": None, "timestamp": now, "duration": self.last_optimization_duration}
 
         return self.optimization_result
 
     def get_element_data(self, element_name: str) -> dict[str, Any] | None:
         """Get data for a specific element directly from the network."""
-        if not self.network or element_name not in self.network.elements:
+        if not self.network:
             return None
 
-        element = self.network.elements[element_name]
-        element_data = {}
+        if element_name in self._element_data_cache:
+            return self._element_data_cache[element_name]
+
+        element = self.network.elements.get(element_name)
+        if element is None:
+            return None
 
-        # Helper to extract values safely
-        def extract_values(variables: list[Any]) -> list[float]:
-            result = []
-            for var in variables:
-                val = value(var)
-                result.append(float(val) if isinstance(val, (int, float)) else 0.0)
-            return result
+        element_data = self._extract_element_data(element)
+        self._element_data_cache[element_name] = element_data
+        return element_data
 
-        # Get power values (net power, can be positive or negative)
-        if hasattr(element, "power") and element.power is not None:
+    def _extract_element_data(self, element: Element | Connection) -> dict[str, Any] | None:
+        """Extract the solved values for an element from the network."""
+        element_data = {}
+
+        if isinstance(element, Connection):
             # Connections have a single power attribute (net flow)
-            element_data[ATTR_POWER] = extract_values(element.power)
-        elif hasattr(element, "power_consumption") and element.power_consumption is not None:
-            # Elements like batteries have separate consumption and production
-            consumption = extract_values(element.power_consumption)
+            element_data[ATTR_POWER] = _extract_values(element.power).tolist()
+            return element_data
+
+        # Other elements have separate consumption and production, either of which may be absent
+        if element.power_consumption is not None or element.power_production is not None:
+            n_periods = self.network.n_periods
+            consumption = (
+                _extract_values(element.power_consumption)
+                if element.power_consumption is not None
+                else np.zeros(n_periods)
+            )
             production = (
-                extract_values(element.power_production)
-                if hasattr(element, "power_production") and element.power_production is not None
-                else [0.0] * len(consumption)
+                _extract_values(element.power_production)
+                if element.power_production is not None
+                else np.zeros(n_periods)
             )
             # Net power = production - consumption (positive = net production, negative = net consumption)
-            element_data[ATTR_POWER] = [p - c for p, c in zip(production, consumption, strict=False)]
+            element_data[ATTR_POWER] = (production - consumption).tolist()
 
-        if hasattr(element, "energy") and element.energy is not None:
-            element_data["energy"] = extract_values(element.energy)
+        if element.energy is not None:
+            element_data[ATTR_ENERGY] = _extract_values(element.energy).tolist()
 
         return element_data if element_data else None
 
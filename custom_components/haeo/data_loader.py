@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import fields
+from functools import cache, lru_cache
 import logging
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor.const import UNIT_CONVERTERS, SensorDeviceClass
-from homeassistant.const import UnitOfEnergy, UnitOfPower
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN, UnitOfEnergy, UnitOfPower
+from homeassistant.core import callback
 import numpy as np
 
 from .const import CONF_ELEMENT_TYPE, FIELD_TYPE_CONSTANT, FIELD_TYPE_FORECAST, FIELD_TYPE_SENSOR
@@ -15,9 +17,13 @@ from .model import Network
 from .types import ELEMENT_TYPES
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant, State
 
+    from .model import Element
+
     # Union type for field values that can be either configuration objects or actual values
     FieldValue = (
         str  # sensor entity IDs
@@ -31,22 +37,65 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sensor states which carry no usable value
+_UNAVAILABLE_STATES = frozenset({STATE_UNKNOWN, STATE_UNAVAILABLE, "none"})
+
+# Property types whose configured values are sensor ids to be loaded
+_SENSOR_PROPERTY_TYPES = frozenset({FIELD_TYPE_SENSOR, FIELD_TYPE_FORECAST})
+
+# Units values are converted to before being used in optimization
+_BASE_UNITS: dict[SensorDeviceClass, str] = {
+    SensorDeviceClass.POWER: UnitOfPower.WATT,
+    SensorDeviceClass.ENERGY: UnitOfEnergy.WATT_HOUR,
+    SensorDeviceClass.ENERGY_STORAGE: UnitOfEnergy.WATT_HOUR,
+}
+
+# Device classes whose sensor values are passed through unit conversion
+_CONVERTIBLE_DEVICE_CLASSES = frozenset(
+    {
+        SensorDeviceClass.POWER,
+        SensorDeviceClass.ENERGY,
+        SensorDeviceClass.ENERGY_STORAGE,
+        SensorDeviceClass.MONETARY,
+        SensorDeviceClass.BATTERY,
+    }
+)
+
 
 def convert_to_base_unit(value: float, from_unit: str | None, device_class: SensorDeviceClass) -> float:
     """Convert a value to base unit used in optimization."""
-    base_units = {
-        SensorDeviceClass.POWER: UnitOfPower.WATT,
-        SensorDeviceClass.ENERGY: UnitOfEnergy.WATT_HOUR,
-        SensorDeviceClass.ENERGY_STORAGE: UnitOfEnergy.WATT_HOUR,
-    }
-
     # Convert if required
-    if device_class in base_units:
-        return UNIT_CONVERTERS.get(device_class).convert(value, from_unit, base_units[device_class])
+    base_unit = _BASE_UNITS.get(device_class)
+    if base_unit is not None:
+        return UNIT_CONVERTERS[device_class].convert(value, from_unit, base_unit)
 
     return value
 
 
+@lru_cache(maxsize=32)
+def _conversion_factor(from_unit: str | None, device_class: SensorDeviceClass) -> float:
+    """Get the factor which converts a value in the given unit to the base unit used in optimization."""
+    # The supported conversions are all linear, so one conversion of unity scales a whole series
+    return convert_to_base_unit(1.0, from_unit, device_class)
+
+
+@lru_cache(maxsize=32)
+def _interp_indices(source_len: int, target_len: int) -> tuple[np.ndarray, np.ndarray]:
+    """Get the source and target sample positions for resampling a series between two lengths."""
+    source_indices = np.arange(source_len)
+    target_indices = np.linspace(0, source_len - 1, target_len)
+    # The arrays are shared between calls, so guard them against being modified in place
+    source_indices.setflags(write=False)
+    target_indices.setflags(write=False)
+    return source_indices, target_indices
+
+
+@cache
+def _field_type_map(config_class: type) -> dict[str, tuple[SensorDeviceClass | str, str] | None]:
+    """Map each field of a configuration class to the field_type in its metadata, or None if it has none."""
+    return {field_info.name: field_info.metadata.get("field_type") for field_info in fields(config_class)}
+
+
 # Field type detection functions
 def get_field_type(field_name: str, config_class: type) -> tuple[SensorDeviceClass | str, str]:
     """Get the field type from metadata.
@@ -62,20 +111,20 @@ def get_field_type(field_name: str, config_class: type) -> tuple[SensorDeviceCla
         ValueError: If field_type is not specified in metadata
 
     """
-    for field_info in fields(config_class):
-        if field_info.name == field_name:
-            # field_type must be specified in metadata
-            field_type = field_info.metadata.get("field_type")
-            if field_type is None:
-                msg = f"Field '{field_name}' in {config_class.__name__} must have 'field_type' specified in metadata"
-                raise ValueError(
-                    msg,
-                )
-
-            return field_type
+    field_types = _field_type_map(config_class)
+    if field_name not in field_types:
+        msg = f"Field '{field_name}' not found in {config_class.__name__}"
+        raise ValueError(msg)
+
+    # field_type must be specified in metadata
+    field_type = field_types[field_name]
+    if field_type is None:
+        msg = f"Field '{field_name}' in {config_class.__name__} must have 'field_type' specified in metadata"
+        raise ValueError(
+            msg,
+        )
 
-    msg = f"Field '{field_name}' not found in {config_class.__name__}"
-    raise ValueError(msg)
+    return field_type
 
 
 def get_field_device_class(field_name: str, config_class: type) -> SensorDeviceClass | str:
@@ -86,11 +135,48 @@ def get_field_device_class(field_name: str, config_class: type) -> SensorDeviceC
 
 def get_field_property_type(field_name: str, config_class: type) -> str | None:
     """Get the property type (constant, sensor, forecast) from field type tuple."""
-    try:
-        field_type = get_field_type(field_name, config_class)
-        return field_type[1]
-    except ValueError:
-        return None
+    # Unknown fields and fields without a type both have no property type, so look it up without raising
+    field_type = _field_type_map(config_class).get(field_name)
+    return field_type[1] if field_type is not None else None
+
+
+def _parse_forecast(raw_forecast: list[Any]) -> np.ndarray:
+    """Parse raw forecast values into a float array.
+
+    Args:
+        raw_forecast: Forecast values as found in the sensor attributes
+
+    Returns:
+        The forecast as a float64 array
+
+    Raises:
+        ValueError: If any value is not a finite number
+
+    """
+    forecast = np.asarray(raw_forecast, dtype=np.float64)
+    # None values are coerced to NaN rather than rejected, so check for them explicitly
+    if not np.isfinite(forecast).all():
+        msg = "Forecast contains non-numeric values"
+        raise ValueError(msg)
+    return forecast
+
+
+@cache
+def _element_fields(config_class: type) -> tuple[tuple[str, str | None], ...]:
+    """Get the loadable fields of an element configuration class along with their property types.
+
+    Args:
+        config_class: The configuration class for the element type
+
+    Returns:
+        Tuples of (field name, property type) for every field except the element type
+
+    """
+    return tuple(
+        (field_info.name, get_field_property_type(field_info.name, config_class))
+        for field_info in fields(config_class)
+        if field_info.name != "element_type"
+    )
 
 
 class DataLoader:
@@ -100,57 +186,115 @@ class DataLoader:
         """Initialize the data loader."""
         self.hass = hass
 
-    async def load_network_data(self, config_entry: ConfigEntry, period_seconds: int, n_periods: int) -> Network:
+        # Network from the last successful load and the (type, params) each of its elements was built from
+        self._network: Network | None = None
+        self._element_params: dict[str, tuple[str, dict[str, Any]]] = {}
+
+        # Sensor ids referenced by the participants mapping they were collected from, which is replaced rather than
+        # modified whenever the configuration changes
+        self._sensor_ids: tuple[Mapping[str, Any], frozenset[str]] | None = None
+
+        # Forecasts parsed during the current network load keyed by their sensor ids, only set while loading
+        self._forecast_cache: dict[tuple[str, ...], list[float] | None] | None = None
+
+    def load_network_data(
+        self,
+        config_entry: ConfigEntry,
+        period_seconds: int,
+        n_periods: int,
+        states: Mapping[str, State | None] | None = None,
+        participants: Mapping[str, Any] | None = None,
+    ) -> Network:
         """Load complete network data from configuration entry.
 
+        When a snapshot of sensor states is given the state machine is not accessed, so the network can be built
+        outside the event loop. The network is always built as a new object and the previous one is left untouched,
+        so it can still be read while this load runs or if it fails.
+
         Args:
             config_entry: The configuration entry containing participants and settings
             period_seconds: Time period in seconds for optimization
             n_periods: Number of time periods for the optimization horizon
+            states: Snapshot of sensor states from snapshot_states, taken here if not given
+            participants: The participants the snapshot was taken from, read from the entry if not given
 
         Returns:
             A fully populated Network object with all elements and their data loaded
 
         """
+        network_name = f"haeo_network_{config_entry.entry_id}"
+
         # Create network with configured horizon and period
         network = Network(
-            name=f"haeo_network_{config_entry.entry_id}",
+            name=network_name,
             period=period_seconds,
             n_periods=n_periods,
         )
 
+        # Elements of the previous network can be carried over while its timing is unchanged, so unchanged elements
+        # don't need rebuilding
+        previous_network = self._network
+        previous: dict[str, tuple[Element, tuple[str, dict[str, Any]]]] = {}
+        if previous_network is not None and (
+            previous_network.name,
+            previous_network.period,
+            previous_network.n_periods,
+        ) == (network_name, period_seconds, n_periods):
+            previous = {
+                element_name: (element, self._element_params[element_name])
+                for element_name, element in previous_network.elements.items()
+                if element_name in self._element_params
+            }
+
         # Get participants from configuration
-        participants = config_entry.data.get("participants", {})
+        if participants is None:
+            participants = config_entry.data.get("participants", {})
 
         if not participants:
             _LOGGER.warning("No participants configured for hub")
+            self._network = network
+            self._element_params = {}
             return network
 
+        # Resolve every referenced sensor state once so all checks and loads in this update see the same snapshot
+        if states is None:
+            states = self.snapshot_states(participants)
+
         # Check sensor availability first
-        sensor_data_available = self._check_sensor_data_availability(config_entry)
+        sensor_data_available = self._check_sensor_data_availability(participants, states)
 
-        # Load all elements from participants
-        for element_name, element_config in participants.items():
-            await self._load_element_data(network, element_name, element_config, n_periods)
+        # Load all elements from participants, parsing each forecast only once even if several elements share it
+        element_params: dict[str, tuple[str, dict[str, Any]]] = {}
+        self._forecast_cache = {}
+        try:
+            for element_name, element_config in participants.items():
+                params_key = self._load_element_data(
+                    network, element_name, element_config, n_periods, states, previous.get(element_name)
+                )
+                if params_key is not None:
+                    element_params[element_name] = params_key
+        finally:
+            self._forecast_cache = None
 
         # Store sensor availability status in the network for the coordinator to use
         network.sensor_data_available = sensor_data_available
 
+        # Only now that every element loaded does this become the network later loads build on
+        self._network = network
+        self._element_params = element_params
+
         return network
 
-    def _check_sensor_data_availability(self, config_entry: ConfigEntry) -> bool:
-        """Check if all required sensor data is available for optimization.
+    def _iter_sensor_ids(self, participants: Mapping[str, Any]) -> Iterator[tuple[str, str, str]]:
+        """Iterate over all sensors referenced by the participants.
 
         Args:
-            config_entry: The configuration entry containing participants and settings
+            participants: The participants mapping from the configuration entry
 
-        Returns:
-            True if all required sensor data is available, False otherwise
+        Yields:
+            Tuples of (element name, field name, sensor id)
 
         """
-        config = config_entry.data
-        participants = config.get("participants", {})
-
         for element_name, element_config in participants.items():
             element_type = element_config[CONF_ELEMENT_TYPE]
             config_class = ELEMENT_TYPES.get(element_type)
@@ -159,19 +303,12 @@ class DataLoader:
                 continue
 
             # Check all sensor fields using the types system
-            for field_info in fields(config_class):
-                field_name = field_info.name
-
-                # Skip element_type and constant fields
-                property_type = get_field_property_type(field_name, config_class)
-                if field_name == "element_type" or property_type == FIELD_TYPE_CONSTANT:
-                    continue
-
+            for field_name, property_type in _element_fields(config_class):
                 # Get field value from configuration
                 field_value = element_config.get(field_name)
 
                 # Check if this is a sensor field that needs data
-                if property_type in [FIELD_TYPE_SENSOR, FIELD_TYPE_FORECAST] and field_value:
+                if property_type in _SENSOR_PROPERTY_TYPES and field_value:
                     if isinstance(field_value, str):
                         sensor_ids = [field_value]
                     elif isinstance(field_value, list) and field_value and isinstance(field_value[0], str):
@@ -180,17 +317,71 @@ class DataLoader:
                         # Skip non-string values (constants, etc.)
                         continue
 
-                    # Check if all sensors are available
                     for sensor_id in sensor_ids:
-                        if not self._is_sensor_available(sensor_id, f"{element_name} {field_name}"):
-                            return False
+                        yield element_name, field_name, sensor_id
+
+    @callback
+    def snapshot_states(self, participants: Mapping[str, Any]) -> dict[str, State | None]:
+        """Look up the state of every sensor referenced by the participants exactly once.
+
+        Reads the state machine, so must be called from the event loop.
+
+        Args:
+            participants: The participants mapping from the configuration entry
+
+        Returns:
+            Mapping of every referenced sensor id to its state, or None for sensors that don't exist
+
+        """
+        # The referenced sensors only change with the configuration, so only walk it when it has been replaced
+        if self._sensor_ids is None or self._sensor_ids[0] is not participants:
+            self._sensor_ids = (
+                participants,
+                frozenset(sensor_id for _, _, sensor_id in self._iter_sensor_ids(participants)),
+            )
+        return {sensor_id: self.hass.states.get(sensor_id) for sensor_id in self._sensor_ids[1]}
+
+    def _get_state(self, sensor_id: str, states: Mapping[str, State | None] | None) -> State | None:
+        """Get a sensor state from the snapshot if one is given, otherwise from the state machine."""
+        if states is not None:
+            return states.get(sensor_id)
+        return self.hass.states.get(sensor_id)
+
+    def _check_sensor_data_availability(
+        self,
+        participants: Mapping[str, Any],
+        states: Mapping[str, State | None] | None = None,
+    ) -> bool:
+        """Check if all required sensor data is available for optimization.
+
+        Args:
+            participants: The participants mapping from the configuration entry
+            states: Optional snapshot of sensor states to check against
+
+        Returns:
+            True if all required sensor data is available, False otherwise
+
+        """
+        # The snapshot holds every referenced sensor, so in the common case of all being available one pass over it
+        # is enough and the participant configuration only needs walking to report what is missing
+        if states is not None and all(
+            state is not None and state.state not in _UNAVAILABLE_STATES for state in states.values()
+        ):
+            return True
+
+        # Check if all sensors are available
+        for element_name, field_name, sensor_id in self._iter_sensor_ids(participants):
+            if not self._is_sensor_available(sensor_id, f"{element_name} {field_name}", states):
+                return False
 
         return True
 
-    def _is_sensor_available(self, sensor_id: str, context: str) -> bool:
+    def _is_sensor_available(
+        self, sensor_id: str, context: str, states: Mapping[str, State | None] | None = None
+    ) -> bool:
         """Check if a sensor is available and has valid state."""
-        state = self.hass.states.get(sensor_id)
-        if not state or state.state in ["unknown", "unavailable", "none"]:
+        state = self._get_state(sensor_id, states)
+        if not state or state.state in _UNAVAILABLE_STATES:
             _LOGGER.warning(
                 "%s sensor %s not available (state: %s)",
                 context,
@@ -200,13 +391,15 @@ class DataLoader:
             return False
         return True
 
-    async def _load_element_data(
+    def _load_element_data(
         self,
         network: Network,
         element_name: str,
         element_config: dict[str, Any],
         n_periods: int,
-    ) -> None:
+        states: Mapping[str, State | None] | None = None,
+        previous: tuple[Element, tuple[str, dict[str, Any]]] | None = None,
+    ) -> tuple[str, dict[str, Any]] | None:
         """Load data for a single element and add it to the network.
 
         Args:
@@ -214,6 +407,11 @@ class DataLoader:
             element_name: Name of the element
             element_config: Configuration for the element
             n_periods: Number of time periods for the optimization
+            states: Optional snapshot of sensor states to load from
+            previous: The element of this name from the previous load and the (type, params) it was built from
+
+        Returns:
+            The (type, params) the element was built from, or None if its type is unknown
 
         """
         element_type = element_config.get(CONF_ELEMENT_TYPE)
@@ -221,33 +419,30 @@ class DataLoader:
 
         if not config_class:
             _LOGGER.error("Unknown element type: %s", element_type)
-            return
-
-        element_params = {}
-
-        # Process all fields from the configuration class
-        for field_info in fields(config_class):
-            field_name = field_info.name
-
-            # Skip element_type field
-            if field_name == "element_type":
-                continue
-
-            # Get field value from configuration
-            field_value = element_config.get(field_name)
-
-            # Load field value using the data loading system
-            loaded_value = await self.load_field_data(field_name, field_value, config_class, n_periods)
-
-            if loaded_value is not None:
-                element_params[field_name] = loaded_value
+            return None
 
-        _LOGGER.debug(
-            "Adding element: %s (%s) with params: %s",
-            element_name,
-            element_type,
-            list(element_params.keys()),
+        # Process all fields from the configuration class, leaving out those without a value
+        loaded_fields = (
+            (field_name, self._load_element_field(element_config.get(field_name), property_type, n_periods, states))
+            for field_name, property_type in _element_fields(config_class)
         )
+        element_params = {field_name: value for field_name, value in loaded_fields if value is not None}
+
+        # Keep the existing element and its LP variables if it would be rebuilt from identical data
+        params_key = (element_type, element_params)
+        if previous is not None and previous[1] == params_key:
+            _LOGGER.debug("Reusing unchanged element: %s (%s)", element_name, element_type)
+            network.elements[element_name] = previous[0]
+            return params_key
+
+        # The parameter name list is built eagerly, so only do so when it will actually be logged
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Adding element: %s (%s) with params: %s",
+                element_name,
+                element_type,
+                list(element_params.keys()),
+            )
 
         try:
             network.add(element_type, element_name, **element_params)
@@ -255,12 +450,28 @@ class DataLoader:
             _LOGGER.exception("Failed to add element %s", element_name)
             raise
 
-    async def load_field_data(
+        return params_key
+
+    def _load_element_field(
+        self,
+        field_value: FieldValue,
+        property_type: str | None,
+        n_periods: int,
+        states: Mapping[str, State | None] | None = None,
+    ) -> FieldValue | None:
+        """Load a field of an element whose property type is already known."""
+        # Sensor fields are loaded using the data loading system, anything else is used as configured
+        if property_type in _SENSOR_PROPERTY_TYPES:
+            return self._load_sensor_field_data(field_value, property_type, n_periods, states)
+        return field_value
+
+    def load_field_data(
         self,
         field_name: str,
         field_value: FieldValue,
         config_class: type,
         n_periods: int | None = None,
+        states: Mapping[str, State | None] | None = None,
     ) -> FieldValue | None:
         """Load field data based on its type and return populated data.
 
@@ -269,6 +480,7 @@ class DataLoader:
             field_value: The field value from configuration (could be sensor ID(s), constant, etc.)
             config_class: The configuration class for the element type
             n_periods: Number of periods for forecast data (uses 1 for current values if None)
+            states: Optional snapshot of sensor states to load from, defaults to the live state machine
 
         Returns:
             The loaded field value (sensor data, forecast data, or constants as-is)
@@ -289,16 +501,17 @@ class DataLoader:
         if property_type == FIELD_TYPE_CONSTANT:
             return field_value
 
-        if property_type in [FIELD_TYPE_SENSOR, FIELD_TYPE_FORECAST]:
-            return await self._load_sensor_field_data(field_value, property_type, n_periods)
+        if property_type in _SENSOR_PROPERTY_TYPES:
+            return self._load_sensor_field_data(field_value, property_type, n_periods, states)
 
         return field_value
 
-    async def _load_sensor_field_data(
+    def _load_sensor_field_data(
         self,
         field_value: FieldValue,
         property_type: str,
         n_periods: int,
+        states: Mapping[str, State | None] | None = None,
     ) -> FieldValue | None:
         """Load sensor or forecast field data."""
         sensor_ids = self._extract_sensor_ids(field_value)
@@ -306,10 +519,16 @@ class DataLoader:
             return field_value
 
         if property_type == FIELD_TYPE_FORECAST:
-            return await self.load_sensor_forecast(sensor_ids, n_periods)
+            if self._forecast_cache is None:
+                return self.load_sensor_forecast(sensor_ids, n_periods, states)
+
+            key = tuple(sensor_ids)
+            if key not in self._forecast_cache:
+                self._forecast_cache[key] = self.load_sensor_forecast(sensor_ids, n_periods, states)
+            return self._forecast_cache[key]
 
         # For single-value sensor fields, sum all sensor values
-        return await self._sum_sensor_values(sensor_ids)
+        return self._sum_sensor_values(sensor_ids, states)
 
     def _extract_sensor_ids(self, field_value: FieldValue) -> list[str] | None:
         """Extract sensor IDs from field value."""
@@ -325,42 +544,33 @@ class DataLoader:
         # Single constant value or other type
         return None
 
-    async def _sum_sensor_values(self, sensor_ids: list[str]) -> float | None:
+    def _sum_sensor_values(
+        self,
+        sensor_ids: list[str],
+        states: Mapping[str, State | None] | None = None,
+    ) -> float | None:
         """Sum values from multiple sensors."""
-        total_value = None
-        for sensor_id in sensor_ids:
-            sensor_value = await self.load_sensor_value(sensor_id)
-            if sensor_value is not None:
-                total_value = total_value + sensor_value if total_value is not None else sensor_value
-        return total_value
+        values = [value for sensor_id in sensor_ids if (value := self.load_sensor_value(sensor_id, states)) is not None]
+        return sum(values) if values else None
 
-    async def _load_current_sensor_values(
+    def _load_current_sensor_values(
         self,
         sensor_ids: list[str],
         n_periods: int,
+        states: Mapping[str, State | None] | None = None,
     ) -> list[float] | None:
         """Load current values from sensors and repeat for all periods."""
-        total_value = None
-
-        for sensor_id in sensor_ids:
-            sensor_value = await self.load_sensor_value(sensor_id)
-            if sensor_value is not None:
-                total_value = total_value + sensor_value if total_value is not None else sensor_value
-
-        # Return as list repeated for all periods, or single value if n_periods=1
-        if total_value is not None:
-            if n_periods == 1:
-                return [total_value]  # Return as single-element list for consistency
-            return [total_value] * n_periods
-        return None
+        total_value = self._sum_sensor_values(sensor_ids, states)
+        return [total_value] * n_periods if total_value is not None else None
 
-    async def load_sensor_value(
+    def load_sensor_value(
         self,
         sensor_id: str,
+        states: Mapping[str, State | None] | None = None,
     ) -> float | None:
         """Load current value from a sensor and convert to base units."""
-        state = self.hass.states.get(sensor_id)
-        if not state or state.state in ["unknown", "unavailable", "none"]:
+        state = self._get_state(sensor_id, states)
+        if not state or state.state in _UNAVAILABLE_STATES:
             _LOGGER.warning("Sensor %s not available (state: %s)", sensor_id, state.state if state else "not found")
             return None
 
@@ -368,25 +578,20 @@ class DataLoader:
             value = float(state.state)
             # Convert to base units if we know the device class from the sensor
             device_class = state.attributes.get("device_class")
-            if device_class and device_class in [
-                SensorDeviceClass.POWER,
-                SensorDeviceClass.ENERGY,
-                SensorDeviceClass.ENERGY_STORAGE,
-                SensorDeviceClass.MONETARY,
-                SensorDeviceClass.BATTERY,
-            ]:
+            if device_class in _CONVERTIBLE_DEVICE_CLASSES:
                 unit = state.attributes.get("unit_of_measurement")
-                value = convert_to_base_unit(value, unit, device_class)
+                value *= _conversion_factor(unit, device_class)
         except (ValueError, TypeError):
             _LOGGER.exception("Invalid numeric value in sensor %s", sensor_id)
             return None
 
         return value
 
-    async def load_sensor_forecast(
+    def load_sensor_forecast(
         self,
         sensor_ids: str | list[str],
         n_periods: int,
+        states: Mapping[str, State | None] | None = None,
     ) -> list[float] | None:
         """Load forecast data from sensor(s) and combine them."""
         if isinstance(sensor_ids, str):
@@ -395,10 +600,12 @@ class DataLoader:
         if not sensor_ids:
             return None
 
-        combined_forecast = None
+        # Accumulate forecasts from all sensors into a single array
+        combined_forecast = np.zeros(n_periods, dtype=np.float64)
+        has_forecast = False
 
         for sensor_id in sensor_ids:
-            state = self.hass.states.get(sensor_id)
+            state = self._get_state(sensor_id, states)
             if not state:
                 _LOGGER.warning("Forecast sensor %s not found", sensor_id)
                 continue
@@ -407,31 +614,21 @@ class DataLoader:
             forecast_attr = state.attributes.get("forecast")
             if forecast_attr and isinstance(forecast_attr, list):
                 try:
-                    raw_forecast = forecast_attr[:n_periods]
-                    _LOGGER.debug("Raw forecast for %s: %d values", sensor_id, len(raw_forecast))
-                    sensor_forecast = [float(x) for x in raw_forecast]
-                    _LOGGER.debug("Converted forecast for %s: %d values", sensor_id, len(sensor_forecast))
+                    sensor_forecast = _parse_forecast(forecast_attr[:n_periods])
                     # Convert to base units using sensor's device class if available
                     sensor_device_class = state.attributes.get("device_class")
-                    if sensor_device_class and sensor_device_class in [
-                        SensorDeviceClass.POWER,
-                        SensorDeviceClass.ENERGY,
-                        SensorDeviceClass.ENERGY_STORAGE,
-                        SensorDeviceClass.MONETARY,
-                        SensorDeviceClass.BATTERY,
-                    ]:
+                    if sensor_device_class in _CONVERTIBLE_DEVICE_CLASSES:
                         unit = state.attributes.get("unit_of_measurement")
-                        sensor_forecast = [convert_to_base_unit(x, unit, sensor_device_class) for x in sensor_forecast]
+                        sensor_forecast *= _conversion_factor(unit, sensor_device_class)
                     # Resample to desired number of periods if needed
                     _LOGGER.debug(
-                        "Forecast data for %s: %d values, target: %d",
+                        "Loaded forecast for %s: %d values, target: %d",
                         sensor_id,
                         len(sensor_forecast),
                         n_periods,
                     )
                     if len(sensor_forecast) != n_periods:
                         sensor_forecast = self._resample_forecast(sensor_forecast, n_periods)
-                    _LOGGER.debug("Loaded forecast for %s: %d values", sensor_id, len(sensor_forecast))
                 except (ValueError, TypeError):
                     _LOGGER.exception("Invalid forecast data in sensor %s", sensor_id)
                     # Fall back to current state value when forecast is invalid
@@ -440,31 +637,27 @@ class DataLoader:
                 # Fallback: repeat current state value
                 sensor_forecast = self._get_repeated_value(state, sensor_id, n_periods)
 
-            if sensor_forecast:
-                if combined_forecast is None:
-                    combined_forecast = sensor_forecast
-                else:
-                    # Sum the forecasts element-wise
-                    combined_forecast = [a + b for a, b in zip(combined_forecast, sensor_forecast, strict=False)]
+            if sensor_forecast is not None:
+                # Sum the forecasts element-wise
+                combined_forecast += sensor_forecast
+                has_forecast = True
 
-        return combined_forecast
+        return combined_forecast.tolist() if has_forecast else None
 
-    def _resample_forecast(self, forecast: list[float], target_periods: int) -> list[float]:
+    def _resample_forecast(self, forecast: Sequence[float] | np.ndarray, target_periods: int) -> np.ndarray:
         """Resample forecast to target number of periods using numpy interpolation."""
+        forecast = np.asarray(forecast, dtype=np.float64)
         if len(forecast) == target_periods:
             return forecast
         if len(forecast) == 0:
-            return [0.0] * target_periods
+            return np.zeros(target_periods)
         if len(forecast) == 1:
             # Single value, repeat for all periods
-            return [forecast[0]] * target_periods
+            return np.full(target_periods, forecast[0])
 
         # Use numpy interpolation for resampling
-        source_indices = np.arange(len(forecast))
-        target_indices = np.linspace(0, len(forecast) - 1, target_periods)
-
-        resampled_values = np.interp(target_indices, source_indices, forecast)
-        return resampled_values.tolist()
+        source_indices, target_indices = _interp_indices(len(forecast), target_periods)
+        return np.interp(target_indices, source_indices, forecast)
 
     def _get_repeated_value(self, state: State, sensor_id: str, n_periods: int) -> list[float] | None:
         """Get repeated current state value for forecast periods."""
@@ -472,15 +665,9 @@ class DataLoader:
             current_value = float(state.state)
             # Convert to base units using sensor's device class
             device_class = state.attributes.get("device_class")
-            if device_class and device_class in [
-                SensorDeviceClass.POWER,
-                SensorDeviceClass.ENERGY,
-                SensorDeviceClass.ENERGY_STORAGE,
-                SensorDeviceClass.MONETARY,
-                SensorDeviceClass.BATTERY,
-            ]:
+            if device_class in _CONVERTIBLE_DEVICE_CLASSES:
                 unit = state.attributes.get("unit_of_measurement")
-                current_value = convert_to_base_unit(current_value, unit, device_class)
+                current_value *= _conversion_factor(unit, device_class)
             return [current_value] * n_periods
         except (ValueError, TypeError):
             _LOGGER.exception("Invalid state value in sensor %s", sensor_id)
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import collections.abc
 from dataclasses import fields
+from functools import cache, lru_cache
 import logging
-from typing import TYPE_CHECKING, Any, Literal, get_type_hints
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.helpers.selector import (
     NumberSelector,
@@ -35,27 +35,47 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Static validators and selectors shared by every network timing form
+_NAME_VALIDATOR = vol.All(
+    str,
+    vol.Strip,
+    vol.Length(min=1, msg="Name cannot be empty"),
+    vol.Length(max=MAX_NAME_LENGTH, msg=f"Name cannot be longer than {MAX_NAME_LENGTH} characters"),
+)
+_HORIZON_HOURS_SELECTOR = NumberSelector(NumberSelectorConfig(min=1, max=MAX_HORIZON_HOURS, step=1, mode="slider"))
+_PERIOD_MINUTES_SELECTOR = NumberSelector(NumberSelectorConfig(min=1, max=MAX_PERIOD_MINUTES, step=1, mode="slider"))
+
+# Connection fields which select one of the existing participants
+_CONNECTION_ENDPOINT_FIELDS = frozenset({CONF_SOURCE, CONF_TARGET})
+
+# Network timing fields as (key, default, maximum, error key)
+NETWORK_TIMING_FIELDS: tuple[tuple[str, int, int, str], ...] = (
+    (CONF_HORIZON_HOURS, DEFAULT_HORIZON_HOURS, MAX_HORIZON_HOURS, "invalid_horizon"),
+    (CONF_PERIOD_MINUTES, DEFAULT_PERIOD_MINUTES, MAX_PERIOD_MINUTES, "invalid_period"),
+)
 
-def _get_participant_options(participants: dict[str, Any]) -> list[str]:
-    """Get list of participant names for dropdown selection."""
-    return list(participants.keys())
+
+@lru_cache(maxsize=32)
+def get_participant_selector(participant_names: tuple[str, ...]) -> SelectSelector:
+    """Get a dropdown selector for the given participant names.
+
+    Selectors are cached by the participant names so re-rendering a form for an unchanged set of
+    participants reuses the existing selector.
+    """
+    return SelectSelector(
+        SelectSelectorConfig(
+            options=list(participant_names),
+            mode=SelectSelectorMode.DROPDOWN,
+        ),
+    )
 
 
 def _create_schema_from_config_class(config_class: type, participants: dict[str, Any] | None = None) -> vol.Schema:
     """Create a voluptuous schema from a config dataclass."""
     schema_dict = {}
 
-    # Get type hints for the class
-    globals_for_hints = {
-        **globals(),
-        "Sequence": collections.abc.Sequence,
-        "Literal": Literal,
-    }
-    type_hints = get_type_hints(config_class, globalns=globals_for_hints)
-
     for field_info in fields(config_class):
         field_name = field_info.name
-        type_hints.get(field_name)
         field_metadata = field_info.metadata
 
         # Skip the element_type field as it's handled separately
@@ -67,15 +87,9 @@ def _create_schema_from_config_class(config_class: type, participants: dict[str,
         optional = field_metadata.get("optional", False)
 
         # Handle special cases for connections
-        if config_class.__name__ == "ConnectionConfig" and field_name in [CONF_SOURCE, CONF_TARGET]:
+        if config_class.__name__ == "ConnectionConfig" and field_name in _CONNECTION_ENDPOINT_FIELDS:
             if participants is not None:
-                participant_options = _get_participant_options(participants)
-                schema = SelectSelector(
-                    SelectSelectorConfig(
-                        options=participant_options,
-                        mode=SelectSelectorMode.DROPDOWN,
-                    ),
-                )
+                schema = get_participant_selector(tuple(participants))
             else:
                 # Fallback if no participants provided
                 schema = vol.All(str, vol.Strip, vol.Length(min=1, msg=f"{field_name} cannot be empty"))
@@ -104,8 +118,17 @@ def get_schema(element_type: str, **kwargs: Any) -> vol.Schema:
         msg = f"Unknown element type: {element_type}"
         raise ValueError(msg)
 
+    # Only connection endpoints depend on the current participants, every other schema is static
     participants = kwargs.get("participants")
-    return _create_schema_from_config_class(config_class, participants)
+    if participants is not None and config_class.__name__ == "ConnectionConfig":
+        return _create_schema_from_config_class(config_class, participants)
+    return _get_static_schema(config_class)
+
+
+@cache
+def _get_static_schema(config_class: type) -> vol.Schema:
+    """Get the schema for a config class built without participant options."""
+    return _create_schema_from_config_class(config_class)
 
 
 def get_network_timing_schema(
@@ -132,30 +155,21 @@ def get_network_timing_schema(
     # Add name field if requested
     if include_name:
         name_field = vol.Required("name") if name_required else vol.Optional("name", default=current_name or "")
-        schema_dict[name_field] = vol.All(
-            str,
-            vol.Strip,
-            vol.Length(min=1, msg="Name cannot be empty"),
-            vol.Length(max=255, msg="Name cannot be longer than 255 characters"),
-        )
+        schema_dict[name_field] = _NAME_VALIDATOR
 
     # Add horizon hours field
     current_horizon = DEFAULT_HORIZON_HOURS
     if config_entry:
         current_horizon = int(config_entry.data.get(CONF_HORIZON_HOURS, DEFAULT_HORIZON_HOURS))
 
-    schema_dict[vol.Required(CONF_HORIZON_HOURS, default=current_horizon)] = NumberSelector(
-        NumberSelectorConfig(min=1, max=168, step=1, mode="slider"),
-    )
+    schema_dict[vol.Required(CONF_HORIZON_HOURS, default=current_horizon)] = _HORIZON_HOURS_SELECTOR
 
     # Add period minutes field
     current_period = DEFAULT_PERIOD_MINUTES
     if config_entry:
         current_period = int(config_entry.data.get(CONF_PERIOD_MINUTES, DEFAULT_PERIOD_MINUTES))
 
-    schema_dict[vol.Required(CONF_PERIOD_MINUTES, default=current_period)] = NumberSelector(
-        NumberSelectorConfig(min=1, max=60, step=1, mode="slider"),
-    )
+    schema_dict[vol.Required(CONF_PERIOD_MINUTES, default=current_period)] = _PERIOD_MINUTES_SELECTOR
 
     return vol.Schema(schema_dict)
 
@@ -180,16 +194,13 @@ def validate_network_timing_input(
 
     """
     errors = {}
+    validated_data: dict[str, Any] = {}
 
-    # Validate horizon hours
-    horizon = int(user_input.get(CONF_HORIZON_HOURS, DEFAULT_HORIZON_HOURS))
-    if not (1 <= horizon <= MAX_HORIZON_HOURS):
-        errors[CONF_HORIZON_HOURS] = "invalid_horizon"
-
-    # Validate period minutes
-    period = int(user_input.get(CONF_PERIOD_MINUTES, DEFAULT_PERIOD_MINUTES))
-    if not (1 <= period <= MAX_PERIOD_MINUTES):
-        errors[CONF_PERIOD_MINUTES] = "invalid_period"
+    # Validate horizon hours and period minutes
+    for key, default, maximum, error in NETWORK_TIMING_FIELDS:
+        validated_data[key] = int(user_input.get(key, default))
+        if not (1 <= validated_data[key] <= maximum):
+            errors[key] = error
 
     # Validate name if required
     if include_name and name_required:
@@ -205,11 +216,6 @@ def validate_network_timing_input(
                     errors["name"] = "name_exists"
                     break
 
-    validated_data = {
-        CONF_HORIZON_HOURS: horizon,
-        CONF_PERIOD_MINUTES: period,
-    }
-
     if include_name:
         validated_data["name"] = name
 
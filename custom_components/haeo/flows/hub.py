@@ -19,6 +19,9 @@ from . import get_network_timing_schema, validate_network_timing_input
 
 _LOGGER = logging.getLogger(__name__)
 
+# The hub creation form has no per-entry defaults so it can be built once
+_USER_SCHEMA = get_network_timing_schema(include_name=True, name_required=True)
+
 
 class HubConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for HAEO hub creation."""
@@ -38,10 +41,9 @@ class HubConfigFlow(ConfigFlow, domain=DOMAIN):
             )
 
             if errors:
-                data_schema = get_network_timing_schema(include_name=True, name_required=True)
                 return self.async_show_form(
                     step_id="user",
-                    data_schema=data_schema,
+                    data_schema=_USER_SCHEMA,
                     errors=errors,
                 )
 
@@ -64,11 +66,9 @@ class HubConfigFlow(ConfigFlow, domain=DOMAIN):
             )
 
         # Show form with network timing configuration
-        data_schema = get_network_timing_schema(include_name=True, name_required=True)
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=_USER_SCHEMA,
         )
 
     @staticmethod
@@ -11,17 +11,25 @@ from homeassistant.helpers.selector import SelectOptionDict, SelectSelector, Sel
 from homeassistant.helpers.translation import async_get_translations
 import voluptuous as vol
 
-from custom_components.haeo.const import CONF_ELEMENT_TYPE, CONF_HORIZON_HOURS, CONF_PERIOD_MINUTES
+from custom_components.haeo.const import CONF_ELEMENT_TYPE, CONF_SOURCE, CONF_TARGET, ELEMENT_TYPE_TRANSLATION_KEYS
 
 if TYPE_CHECKING:
     from homeassistant.data_entry_flow import FlowResult
 
 from custom_components.haeo.types import ELEMENT_TYPES
 
-from . import get_network_timing_schema, get_schema
+from . import NETWORK_TIMING_FIELDS, get_network_timing_schema, get_participant_selector, get_schema
 
 _LOGGER = logging.getLogger(__name__)
 
+_MENU_OPTIONS = ("configure_network", "add_participant")
+_MENU_OPTIONS_WITH_PARTICIPANTS = (*_MENU_OPTIONS, "edit_participant", "remove_participant")
+
+
+def _participant_selection_schema(participants: dict[str, Any]) -> vol.Schema:
+    """Create the schema for picking one of the existing participants."""
+    return vol.Schema({vol.Required("participant"): get_participant_selector(tuple(participants))})
+
 
 class HubOptionsFlow(config_entries.OptionsFlow):
     """Handle options flow for HAEO hub."""
@@ -31,29 +39,23 @@ class HubOptionsFlow(config_entries.OptionsFlow):
         # Check if we have participants for conditional menu options
         participants = self.config_entry.data.get("participants", {})
 
-        # Build menu options based on available participants
-        menu_options = ["configure_network", "add_participant"]
-
-        if participants:
-            menu_options.extend(["edit_participant", "remove_participant"])
-
+        # Editing and removing are only offered once there are participants to act on
         return self.async_show_menu(
             step_id="init",
-            menu_options=menu_options,
+            menu_options=_MENU_OPTIONS_WITH_PARTICIPANTS if participants else _MENU_OPTIONS,
         )
 
     async def async_step_configure_network(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Configure network timing parameters."""
         if user_input is not None:
             # Update network timing configuration
-            new_data = self.config_entry.data.copy()
-            new_data[CONF_HORIZON_HOURS] = user_input[CONF_HORIZON_HOURS]
-            new_data[CONF_PERIOD_MINUTES] = user_input[CONF_PERIOD_MINUTES]
+            new_data = {
+                **self.config_entry.data,
+                **{key: user_input[key] for key, *_ in NETWORK_TIMING_FIELDS},
+            }
 
+            # The entry's update listener refreshes the coordinator in place with the new timing
             self.hass.config_entries.async_update_entry(self.config_entry, data=new_data)
-
-            # Reload the integration once so new timing takes effect
-            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
             return self.async_create_entry(title="", data={})
 
         # Show form with network timing configuration
@@ -79,7 +81,10 @@ class HubOptionsFlow(config_entries.OptionsFlow):
 
         # Create options with translated labels
         options = [
-            SelectOptionDict(value=element_type, label=translations.get(f"entity.device.{element_type}", element_type))
+            SelectOptionDict(
+                value=element_type,
+                label=translations.get(ELEMENT_TYPE_TRANSLATION_KEYS[element_type], element_type),
+            )
             for element_type in ELEMENT_TYPES
         ]
 
@@ -147,20 +152,9 @@ class HubOptionsFlow(config_entries.OptionsFlow):
             # Route to generic configure step for editing
             return await self.async_step_configure_element(participant_type, current_config=participant_config)
 
-        participant_options = list(participants.keys())
-
         return self.async_show_form(
             step_id="edit_participant",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("participant"): SelectSelector(
-                        SelectSelectorConfig(
-                            options=participant_options,
-                            mode=SelectSelectorMode.DROPDOWN,
-                        ),
-                    ),
-                },
-            ),
+            data_schema=_participant_selection_schema(participants),
         )
 
     async def async_step_remove_participant(self, user_input: dict[str, Any] | None = None) -> FlowResult:
@@ -173,32 +167,20 @@ class HubOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             participant_name = user_input["participant"]
 
-            # Remove participant from configuration
-            new_data = self.config_entry.data.copy()
-            new_participants = new_data["participants"].copy()
-            del new_participants[participant_name]
-            new_data["participants"] = new_participants
+            # Remove the participant along with any connections to or from it in a single pass
+            new_participants = {
+                name: config
+                for name, config in participants.items()
+                if name != participant_name
+                and participant_name not in (config.get(CONF_SOURCE), config.get(CONF_TARGET))
+            }
 
-            self.hass.config_entries.async_update_entry(self.config_entry, data=new_data)
-
-            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
-            return self.async_create_entry(title="", data={})
+            return self._save_participants(new_participants)
 
         # Show form for participant selection
-        participant_options = list(participants.keys())
-
         return self.async_show_form(
             step_id="remove_participant",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("participant"): SelectSelector(
-                        SelectSelectorConfig(
-                            options=participant_options,
-                            mode=SelectSelectorMode.DROPDOWN,
-                        ),
-                    ),
-                },
-            ),
+            data_schema=_participant_selection_schema(participants),
         )
 
     def _check_participant_name_exists(self, name: str, exclude_current: str | None = None) -> bool:
@@ -210,35 +192,43 @@ class HubOptionsFlow(config_entries.OptionsFlow):
         # If we're creating, don't allow any duplicates
         return name in participants
 
+    def _save_participants(self, participants: dict[str, Any]) -> FlowResult:
+        """Store an updated participants mapping on the config entry and finish the flow."""
+        new_data = {**self.config_entry.data, "participants": participants}
+
+        # The entry's update listener schedules the reload needed to rebuild entities for the new participants
+        self.hass.config_entries.async_update_entry(self.config_entry, data=new_data)
+        return self.async_create_entry(title="", data={})
+
     async def _add_participant(self, name: str, participant_config: dict[str, Any]) -> FlowResult:
         """Add a participant to the configuration."""
-        new_data = self.config_entry.data.copy()
-        new_participants = new_data["participants"].copy()
+        new_participants = self.config_entry.data["participants"].copy()
         new_participants[name] = participant_config
-        new_data["participants"] = new_participants
 
-        self.hass.config_entries.async_update_entry(self.config_entry, data=new_data)
-
-        await self.hass.config_entries.async_reload(self.config_entry.entry_id)
-        return self.async_create_entry(title="", data={})
+        return self._save_participants(new_participants)
 
     async def _update_participant(self, old_name: str, new_config: dict[str, Any]) -> FlowResult:
         """Update a participant in the configuration."""
-        new_data = self.config_entry.data.copy()
-        new_participants = new_data["participants"].copy()
-
-        # Remove old participant and add updated one
-        if old_name in new_participants:
-            del new_participants[old_name]
-
+        participants = self.config_entry.data["participants"]
         new_name = new_config[CONF_NAME]
-        new_participants[new_name] = new_config
-
-        new_data["participants"] = new_participants
 
-        self.hass.config_entries.async_update_entry(self.config_entry, data=new_data)
-
-        return self.async_create_entry(title="", data={})
+        # Replace the participant in place and repoint any connections if it was renamed, in a single pass
+        new_participants: dict[str, Any] = {}
+        for name, config in participants.items():
+            if name == old_name:
+                new_participants[new_name] = new_config
+            elif new_name != old_name and old_name in (config.get(CONF_SOURCE), config.get(CONF_TARGET)):
+                new_participants[name] = {
+                    **config,
+                    **{key: new_name for key in (CONF_SOURCE, CONF_TARGET) if config.get(key) == old_name},
+                }
+            else:
+                new_participants[name] = config
+
+        if old_name not in participants:
+            new_participants[new_name] = new_config
+
+        return self._save_participants(new_participants)
 
 
 # Dynamically create specific configure methods for each element type
@@ -1,4 +1,5 @@
 """HAEO energy modeling components."""
 
+from .connection import Connection as Connection
 from .element import Element as Element
 from .network import Network as Network
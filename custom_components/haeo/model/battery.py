@@ -9,6 +9,8 @@ from .element import Element
 class Battery(Element):
     """Battery entity for electrical system modeling."""
 
+    __slots__ = ("capacity",)
+
     def __init__(
         self,
         name: str,
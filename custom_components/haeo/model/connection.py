@@ -10,6 +10,8 @@ from pulp import LpConstraint, LpVariable
 class Connection:
     """Connection class for electrical system modeling."""
 
+    __slots__ = ("name", "power", "source", "target")
+
     def __init__(
         self,
         name: str,
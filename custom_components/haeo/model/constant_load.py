@@ -6,6 +6,8 @@ from .element import Element
 class ConstantLoad(Element):
     """Constant load entity for electrical system modeling."""
 
+    __slots__ = ()
+
     def __init__(self, name: str, period: int, n_periods: int, *, power: float) -> None:
         """Initialize a constant load.
 
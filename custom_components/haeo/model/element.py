@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from pulp import LpConstraint, LpVariable, lpSum
 
 
-@dataclass
+@dataclass(slots=True)
 class Element:
     """Generic electrical entity which models the relationship between power and energy."""
 
@@ -8,6 +8,8 @@ from .element import Element
 class ForecastLoad(Element):
     """Forecast-based load entity for electrical system modeling."""
 
+    __slots__ = ()
+
     def __init__(self, name: str, period: int, n_periods: int, forecast: Sequence[float]) -> None:
         """Initialize a forecast-based load.
 
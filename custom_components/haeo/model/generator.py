@@ -11,6 +11,8 @@ from .element import Element
 class Generator(Element):
     """Generator entity for electrical system modeling."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
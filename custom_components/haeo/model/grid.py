@@ -11,6 +11,8 @@ from .element import Element
 class Grid(Element):
     """Unified Grid entity for electrical system modeling with separate import/export pricing."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -6,6 +6,8 @@ from .element import Element
 class Net(Element):
     """Net entity for electrical system modeling."""
 
+    __slots__ = ()
+
     def __init__(self, name: str, period: int, n_periods: int) -> None:
         """Initialize a net entity.
 
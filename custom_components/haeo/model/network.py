@@ -3,7 +3,7 @@
 from collections.abc import MutableSequence, Sequence
 from dataclasses import dataclass, field
 
-from pulp import LpConstraint, LpMinimize, LpProblem, LpStatus, lpSum, value
+from pulp import LpConstraint, LpMinimize, LpProblem, LpSolver, LpStatus, lpSum, value
 
 from .battery import Battery
 from .connection import Connection
@@ -14,6 +14,17 @@ from .generator import Generator
 from .grid import Grid
 from .net import Net
 
+# Element classes keyed by their configuration type
+_ELEMENT_CLASSES: dict[str, type[Element | Connection]] = {
+    "battery": Battery,
+    "generator": Generator,
+    "constant_load": ConstantLoad,
+    "forecast_load": ForecastLoad,
+    "grid": Grid,
+    "net": Net,
+    "connection": Connection,
+}
+
 
 @dataclass
 class Network:
@@ -37,16 +48,9 @@ class Network:
             The created element
 
         """
-        # Set n_periods if not provided and required by element type
-        self.elements[name] = {
-            "battery": Battery,
-            "generator": Generator,
-            "constant_load": ConstantLoad,
-            "forecast_load": ForecastLoad,
-            "grid": Grid,
-            "net": Net,
-            "connection": Connection,
-        }[element_type.lower()](name=name, period=self.period, n_periods=self.n_periods, **kwargs)
+        self.elements[name] = _ELEMENT_CLASSES[element_type.lower()](
+            name=name, period=self.period, n_periods=self.n_periods, **kwargs
+        )
         return self.elements[name]
 
     def constraints(self) -> Sequence[LpConstraint]:
@@ -57,9 +61,19 @@ class Network:
         for element in self.elements.values():
             constraints.extend(element.constraints())
 
+        # Index connections by the elements they join so each balance only visits its own connections
+        outgoing: dict[str, list[Connection]] = {}
+        incoming: dict[str, list[Connection]] = {}
+        for conn_element in self.elements.values():
+            if isinstance(conn_element, Connection):
+                outgoing.setdefault(conn_element.source, []).append(conn_element)
+                incoming.setdefault(conn_element.target, []).append(conn_element)
+
         # Add power balance constraints for each element based on the connections
-        # We need to identify connection elements and handle their power flows
         for element in self.elements.values():
+            element_outgoing = outgoing.get(element.name, ())
+            element_incoming = incoming.get(element.name, ())
+
             for t in range(self.n_periods):
                 balance_terms = []
 
@@ -70,15 +84,10 @@ class Network:
                     if element.power_production is not None:
                         balance_terms.append(element.power_production[t])
 
-                # Add connection flows - check if this element is connected via connection elements
-                for conn_element in self.elements.values():
-                    if isinstance(conn_element, Connection):
-                        if conn_element.source == element.name:
-                            # Power leaving the element (negative for balance)
-                            balance_terms.append(-conn_element.power[t])
-                        elif conn_element.target == element.name:
-                            # Power entering the element (positive for balance)
-                            balance_terms.append(conn_element.power[t])
+                # Power leaving the element (negative for balance)
+                balance_terms.extend(-conn_element.power[t] for conn_element in element_outgoing)
+                # Power entering the element (positive for balance)
+                balance_terms.extend(conn_element.power[t] for conn_element in element_incoming)
 
                 # Power balance: sum of all terms should be zero
                 if balance_terms:
@@ -88,13 +97,17 @@ class Network:
 
     def cost(self) -> float:
         """Return the cost expression for the network."""
-        return lpSum([e.cost() for e in self.elements.values() if e.cost() != 0])
+        # Each element's cost expression is built once, then elements which contribute nothing are dropped
+        return lpSum([cost for e in self.elements.values() if (cost := e.cost()) != 0])
 
-    def optimize(self) -> float:
+    def optimize(self, solver: LpSolver | None = None) -> float:
         """Solve the optimization problem and return the cost.
 
         After optimization, access optimized values directly from elements and connections.
 
+        Args:
+            solver: Solver to use, defaults to PuLP's default solver
+
         Returns:
             The total optimization cost
 
@@ -110,7 +123,7 @@ class Network:
             prob += constraint
 
         # Solve the problem
-        status = prob.solve()
+        status = prob.solve(solver)
 
         if status == 1:  # Optimal solution found
             objective_value = value(prob.objective) if prob.objective is not None else 0.0
@@ -1,40 +1,52 @@
 """Sensor platform for Home Assistant Energy Optimization integration."""
 
+from __future__ import annotations
+
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfEnergy, UnitOfPower, UnitOfTime
-from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     ATTR_ENERGY,
     ATTR_POWER,
+    CONF_ELEMENT_TYPE,
     DOMAIN,
+    ELEMENT_TYPE_TRANSLATION_KEYS,
     OPTIMIZATION_STATUS_PENDING,
     OPTIMIZATION_STATUS_SUCCESS,
     UNIT_CURRENCY,
 )
 from .coordinator import HaeoDataUpdateCoordinator
 
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from . import HaeoConfigEntry
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def _element_device_model(element_type: str) -> str:
+    """Get the translation key used as the device model for an element type."""
+    # Participants stored with an unknown or legacy type fall back to a key built from the type itself
+    return ELEMENT_TYPE_TRANSLATION_KEYS.get(element_type) or f"entity.device.{element_type}"
+
+
 def get_device_info_for_element(element_name: str, element_type: str, config_entry: ConfigEntry) -> DeviceInfo:
     """Get device info for a specific element."""
-    # Use translation key for the model name - Home Assistant will resolve this
-    model_translation_key = f"entity.device.{element_type}"
-
     return DeviceInfo(
         identifiers={(DOMAIN, f"{config_entry.entry_id}_{element_name}")},
         name=element_name,
         manufacturer="HAEO",
-        model=model_translation_key,
+        # Use translation key for the model name - Home Assistant will resolve this
+        model=_element_device_model(element_type),
         via_device=(DOMAIN, config_entry.entry_id),
     )
 
@@ -67,21 +79,21 @@ async def async_register_devices(hass: HomeAssistant, config_entry: ConfigEntry)
     # Register devices for each participant element
     participants = config_entry.data.get("participants", {})
     for element_name, element_config in participants.items():
-        element_type = element_config.get("type", "")
+        element_type = element_config.get(CONF_ELEMENT_TYPE, "")
 
         device_registry_client.async_get_or_create(
             config_entry_id=config_entry.entry_id,
             identifiers={(DOMAIN, f"{config_entry.entry_id}_{element_name}")},
             name=element_name,
             manufacturer="HAEO",
-            model=f"entity.device.{element_type}",
+            model=_element_device_model(element_type),
             via_device=(DOMAIN, config_entry.entry_id),
         )
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,
+    config_entry: HaeoConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up HAEO sensor platform."""
@@ -119,7 +131,7 @@ def _create_sensors(
     # Add element-specific sensors
     participants = config_entry.data.get("participants", {})
     for element_name, element_config in participants.items():
-        element_type = element_config.get("type", "")
+        element_type = element_config.get(CONF_ELEMENT_TYPE, "")
 
         # Determine which sensors to create for this element
         sensor_configs = _get_element_sensor_configs(coordinator, element_name)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, NamedTuple
+from unittest.mock import patch
 
 from homeassistant.const import CONF_NAME
 from homeassistant.data_entry_flow import FlowResultType
@@ -13,6 +14,8 @@ from custom_components.haeo.const import (
     CONF_CAPACITY,
     CONF_ELEMENT_TYPE,
     CONF_IMPORT_LIMIT,
+    CONF_SOURCE,
+    CONF_TARGET,
     DOMAIN,
     ELEMENT_TYPE_BATTERY,
     ELEMENT_TYPE_CONNECTION,
@@ -422,6 +425,75 @@ async def test_options_flow_no_participants(options_flow) -> None:
     assert result.get("reason") == "no_participants"
 
 
+async def test_options_flow_remove_participant_removes_connections(hass: HomeAssistant) -> None:
+    """Test removing a participant also removes connections that reference it."""
+    config_entry = create_mock_config_entry(
+        data={
+            "integration_type": "hub",
+            "name": "Test Hub",
+            "participants": {
+                **MOCK_PARTICIPANTS,
+                "Battery1_Grid1": {
+                    CONF_ELEMENT_TYPE: ELEMENT_TYPE_CONNECTION,
+                    CONF_SOURCE: "Battery1",
+                    CONF_TARGET: "Grid1",
+                },
+                "Load1_Grid1": {
+                    CONF_ELEMENT_TYPE: ELEMENT_TYPE_CONNECTION,
+                    CONF_SOURCE: "Grid1",
+                    CONF_TARGET: "Load1",
+                },
+            },
+        },
+    )
+    config_entry.add_to_hass(hass)
+
+    options_flow = HubOptionsFlow()
+    options_flow.hass = hass
+    options_flow._config_entry = config_entry
+
+    with patch.object(hass.config_entries, "async_schedule_reload") as mock_reload:
+        result = await options_flow.async_step_remove_participant({"participant": "Battery1"})
+
+    assert result.get("type") == FlowResultType.CREATE_ENTRY
+    assert list(config_entry.data["participants"]) == ["Grid1", "Load1", "Load1_Grid1"]
+    # Reloading is left to the entry's update listener
+    mock_reload.assert_not_called()
+
+
+async def test_options_flow_rename_participant_updates_connections(hass: HomeAssistant) -> None:
+    """Test renaming a participant keeps its position and repoints connections to the new name."""
+    config_entry = create_mock_config_entry(
+        data={
+            "integration_type": "hub",
+            "name": "Test Hub",
+            "participants": {
+                **MOCK_PARTICIPANTS,
+                "Battery1_Grid1": {
+                    CONF_ELEMENT_TYPE: ELEMENT_TYPE_CONNECTION,
+                    CONF_SOURCE: "Battery1",
+                    CONF_TARGET: "Grid1",
+                },
+            },
+        },
+    )
+    config_entry.add_to_hass(hass)
+
+    options_flow = HubOptionsFlow()
+    options_flow.hass = hass
+    options_flow._config_entry = config_entry
+
+    new_config = {CONF_ELEMENT_TYPE: ELEMENT_TYPE_GRID, CONF_NAME: "MainGrid", CONF_IMPORT_LIMIT: 5000}
+    result = await options_flow._update_participant("Grid1", new_config)
+
+    assert result.get("type") == FlowResultType.CREATE_ENTRY
+    participants = config_entry.data["participants"]
+    assert list(participants) == ["Battery1", "MainGrid", "Load1", "Battery1_Grid1"]
+    assert participants["MainGrid"] == new_config
+    assert participants["Battery1_Grid1"][CONF_SOURCE] == "Battery1"
+    assert participants["Battery1_Grid1"][CONF_TARGET] == "MainGrid"
+
+
 # Parameterized tests for successful configuration submissions
 @pytest.mark.parametrize(("element_type", "valid_case", "description"), VALID_TEST_DATA_WITH_IDS)
 async def test_options_flow_configure_success(
@@ -93,11 +93,8 @@ async def test_update_data_success(mock_optimize, hass: HomeAssistant, mock_conf
     mock_cost = 100.0
     mock_optimize.return_value = mock_cost
 
-    async def async_job() -> float:
-        return mock_cost
-
-    with patch.object(hass, "async_add_executor_job", return_value=async_job()):
-        result = await coordinator._async_update_data()
+    result = await coordinator._async_update_data()
+    await coordinator.async_shutdown()
 
     assert result is not None
     assert coordinator.optimization_status == OPTIMIZATION_STATUS_SUCCESS
@@ -105,6 +102,62 @@ async def test_update_data_success(mock_optimize, hass: HomeAssistant, mock_conf
     assert coordinator.optimization_result["cost"] == mock_cost
 
 
+@patch("custom_components.haeo.model.network.Network.optimize")
+async def test_update_data_reuses_solution_when_unchanged(
+    mock_optimize, hass: HomeAssistant, mock_config_entry
+) -> None:
+    """Test the solve is skipped when no element changed since the last optimization."""
+    hass.states.async_set("sensor.battery_charge", "50", {})
+    mock_optimize.return_value = 100.0
+
+    coordinator = HaeoDataUpdateCoordinator(hass, mock_config_entry)
+
+    await coordinator._async_update_data()
+    result = await coordinator._async_update_data()
+    assert mock_optimize.call_count == 1
+    assert result["cost"] == 100.0
+
+    # A changed sensor value rebuilds the battery so the network must be solved again
+    hass.states.async_set("sensor.battery_charge", "60", {})
+    await coordinator._async_update_data()
+    await coordinator.async_shutdown()
+
+    assert mock_optimize.call_count == 2
+
+
+@patch("custom_components.haeo.model.network.Network.optimize")
+async def test_update_data_after_participant_edit(mock_optimize, hass: HomeAssistant, mock_config_entry) -> None:
+    """Test an edited participant referencing a new sensor is loaded from the entry's current data."""
+    hass.states.async_set("sensor.battery_charge", "50", {})
+    hass.states.async_set("sensor.other_charge", "80", {})
+    mock_optimize.return_value = 100.0
+    mock_config_entry.add_to_hass(hass)
+
+    coordinator = HaeoDataUpdateCoordinator(hass, mock_config_entry)
+    await coordinator._async_update_data()
+
+    # Edit the battery to read a sensor the previous configuration did not reference
+    participants = mock_config_entry.data[CONF_PARTICIPANTS]
+    hass.config_entries.async_update_entry(
+        mock_config_entry,
+        data={
+            **mock_config_entry.data,
+            CONF_PARTICIPANTS: {
+                **participants,
+                "test_battery": {**participants["test_battery"], CONF_INITIAL_CHARGE_PERCENTAGE: "sensor.other_charge"},
+            },
+        },
+    )
+
+    result = await coordinator._async_update_data()
+    await coordinator.async_shutdown()
+
+    assert result["cost"] == 100.0
+    assert coordinator.network.sensor_data_available
+    assert coordinator.optimization_status == OPTIMIZATION_STATUS_SUCCESS
+    assert coordinator.network.elements["test_battery"].energy[0] == 8000.0
+
+
 @patch("custom_components.haeo.model.network.Network.optimize")
 async def test_update_data_failure(mock_optimize, hass: HomeAssistant, mock_config_entry) -> None:
     """Test failed data update."""
@@ -118,8 +171,8 @@ async def test_update_data_failure(mock_optimize, hass: HomeAssistant, mock_conf
     # Mock optimization failure
     mock_optimize.side_effect = Exception("Optimization failed")
 
-    with patch.object(hass, "async_add_executor_job", side_effect=Exception("Optimization failed")):
-        result = await coordinator._async_update_data()
+    result = await coordinator._async_update_data()
+    await coordinator.async_shutdown()
 
     # Should return dict with None cost for optimization failures during configuration
     assert result is not None
@@ -155,6 +208,29 @@ def test_get_element_data(hass: HomeAssistant, mock_config_entry) -> None:
     assert len(result[ATTR_ENERGY]) == 3
 
 
+def test_get_element_data_cached_until_update(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test element data is extracted once and reused until the network changes."""
+    coordinator = HaeoDataUpdateCoordinator(hass, mock_config_entry)
+
+    coordinator.network = Network("test", period=3600, n_periods=3)
+    coordinator.network.add(
+        ELEMENT_TYPE_BATTERY,
+        "test_battery",
+        capacity=1000,
+        initial_charge_percentage=50,
+        max_charge_power=100,
+        max_discharge_power=100,
+    )
+    coordinator.network.optimize()
+
+    with patch.object(coordinator, "_extract_element_data", wraps=coordinator._extract_element_data) as mock_extract:
+        first = coordinator.get_element_data("test_battery")
+        second = coordinator.get_element_data("test_battery")
+
+    assert first is second
+    mock_extract.assert_called_once_with(coordinator.network.elements["test_battery"])
+
+
 def test_get_element_data_no_result(hass: HomeAssistant, mock_config_entry) -> None:
     """Test getting entity data with no optimization result."""
     coordinator = HaeoDataUpdateCoordinator(hass, mock_config_entry)
@@ -233,3 +309,53 @@ async def test_update_data_network_build_failure(hass: HomeAssistant, mock_confi
         await coordinator._async_update_data()
 
     assert coordinator.optimization_status == OPTIMIZATION_STATUS_FAILED
+
+
+@patch("custom_components.haeo.model.network.Network.optimize")
+async def test_update_data_network_build_failure_keeps_previous_network(
+    mock_optimize, hass: HomeAssistant, mock_config_entry
+) -> None:
+    """Test a failed network build leaves the previous network and its extracted data in place."""
+    hass.states.async_set("sensor.battery_charge", "50", {})
+    mock_optimize.return_value = 100.0
+
+    coordinator = HaeoDataUpdateCoordinator(hass, mock_config_entry)
+    await coordinator._async_update_data()
+    network = coordinator.network
+    element_data = coordinator.get_element_data("test_battery")
+
+    with patch.object(coordinator.data_loader, "load_network_data", side_effect=Exception("Network build failed")):
+        await coordinator._async_update_data()
+    await coordinator.async_shutdown()
+
+    assert coordinator.network is network
+    assert coordinator.get_element_data("test_battery") is element_data
+
+
+async def test_update_data_coalesces_with_running_update(hass: HomeAssistant, mock_config_entry) -> None:
+    """Test an update started while another is running returns the current result without loading again."""
+    coordinator = HaeoDataUpdateCoordinator(hass, mock_config_entry)
+    coordinator.data = {"cost": 100.0, "timestamp": datetime.now(), "duration": 1.0}
+
+    with patch.object(coordinator.data_loader, "load_network_data") as mock_load:
+        async with coordinator._update_lock:
+            result = await coordinator._async_update_data()
+
+    assert result is coordinator.data
+    mock_load.assert_not_called()
+
+
+async def test_update_data_no_participants(hass: HomeAssistant) -> None:
+    """Test an update with no participants returns without building or solving a network."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_NAME: "Empty Network", CONF_HORIZON_HOURS: 1, CONF_PERIOD_MINUTES: 5, CONF_PARTICIPANTS: {}},
+    )
+    coordinator = HaeoDataUpdateCoordinator(hass, entry)
+
+    with patch.object(coordinator.data_loader, "load_network_data") as mock_load:
+        result = await coordinator._async_update_data()
+
+    assert result["cost"] is None
+    assert coordinator.network is None
+    mock_load.assert_not_called()
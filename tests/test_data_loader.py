@@ -2,20 +2,27 @@
 
 from dataclasses import dataclass, field
 from typing import Any
+from unittest.mock import patch
 
 from homeassistant.components.sensor.const import SensorDeviceClass
 from homeassistant.const import UnitOfPower
 from homeassistant.core import HomeAssistant
 import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.haeo.const import (
     ATTR_FORECAST,
     CONF_CAPACITY,
     CONF_EFFICIENCY,
+    CONF_ELEMENT_TYPE,
     CONF_FORECAST,
     CONF_IMPORT_PRICE,
     CONF_INITIAL_CHARGE_PERCENTAGE,
     CONF_MIN_CHARGE_PERCENTAGE,
+    CONF_PARTICIPANTS,
+    DOMAIN,
+    ELEMENT_TYPE_BATTERY,
+    ELEMENT_TYPE_NET,
     FIELD_TYPE_CONSTANT,
     FIELD_TYPE_FORECAST,
     FIELD_TYPE_SENSOR,
@@ -27,6 +34,7 @@ from custom_components.haeo.data_loader import (
     get_field_property_type,
     get_field_type,
 )
+from custom_components.haeo.model import Network
 
 
 # Mock configuration classes for testing field type detection
@@ -232,7 +240,7 @@ async def test_load_sensor_value_available_power(hass: HomeAssistant, sensor_loa
         attributes={"device_class": SensorDeviceClass.POWER, "unit_of_measurement": UnitOfPower.WATT},
     )
 
-    result = await sensor_loader.load_sensor_value("sensor.test_power")
+    result = sensor_loader.load_sensor_value("sensor.test_power")
     assert result == 1000.0
 
 
@@ -243,7 +251,7 @@ async def test_load_sensor_value_available_energy(hass: HomeAssistant, sensor_lo
         "sensor.test_energy", "5.5", attributes={"device_class": SensorDeviceClass.ENERGY, "unit_of_measurement": "kWh"}
     )
 
-    result = await sensor_loader.load_sensor_value("sensor.test_energy")
+    result = sensor_loader.load_sensor_value("sensor.test_energy")
     assert result == 5500.0  # 5.5 kWh = 5500 Wh
 
 
@@ -254,7 +262,7 @@ async def test_load_sensor_value_available_battery(hass: HomeAssistant, sensor_l
         "sensor.test_battery", "75", attributes={"device_class": SensorDeviceClass.BATTERY, "unit_of_measurement": "%"}
     )
 
-    result = await sensor_loader.load_sensor_value("sensor.test_battery")
+    result = sensor_loader.load_sensor_value("sensor.test_battery")
     assert result == 75.0
 
 
@@ -262,7 +270,7 @@ async def test_load_sensor_value_unavailable_sensor(hass: HomeAssistant, sensor_
     """Test loading value from unavailable sensor."""
     # Don't set any state for the sensor - it should be unavailable
 
-    result = await sensor_loader.load_sensor_value("sensor.unavailable")
+    result = sensor_loader.load_sensor_value("sensor.unavailable")
     assert result is None
 
 
@@ -271,7 +279,7 @@ async def test_load_sensor_value_unknown_state(hass: HomeAssistant, sensor_loade
     # Set up sensor state with unknown value
     hass.states.async_set("sensor.unknown", "unknown")
 
-    result = await sensor_loader.load_sensor_value("sensor.unknown")
+    result = sensor_loader.load_sensor_value("sensor.unknown")
     assert result is None
 
 
@@ -280,10 +288,130 @@ async def test_load_sensor_value_invalid_number(hass: HomeAssistant, sensor_load
     # Set up sensor state with invalid number
     hass.states.async_set("sensor.invalid", "not_a_number")
 
-    result = await sensor_loader.load_sensor_value("sensor.invalid")
+    result = sensor_loader.load_sensor_value("sensor.invalid")
     assert result is None
 
 
+async def test_snapshot_states_resolves_referenced_sensors(hass: HomeAssistant, sensor_loader) -> None:
+    """Test the state snapshot contains each existing referenced sensor and is used for loading."""
+    hass.states.async_set("sensor.battery_soc", "50", attributes={"device_class": SensorDeviceClass.BATTERY})
+
+    participants = {
+        "battery": {
+            CONF_ELEMENT_TYPE: ELEMENT_TYPE_BATTERY,
+            CONF_CAPACITY: 10000,
+            CONF_INITIAL_CHARGE_PERCENTAGE: "sensor.battery_soc",
+        },
+        "other_battery": {
+            CONF_ELEMENT_TYPE: ELEMENT_TYPE_BATTERY,
+            CONF_CAPACITY: 10000,
+            CONF_INITIAL_CHARGE_PERCENTAGE: "sensor.missing",
+        },
+    }
+
+    states = sensor_loader.snapshot_states(participants)
+    assert set(states) == {"sensor.battery_soc", "sensor.missing"}
+    assert states["sensor.missing"] is None
+
+    # Values are read from the snapshot rather than the live state machine
+    hass.states.async_set("sensor.battery_soc", "80", attributes={"device_class": SensorDeviceClass.BATTERY})
+    assert sensor_loader.load_sensor_value("sensor.battery_soc", states) == 50.0
+    assert sensor_loader.load_sensor_value("sensor.missing", states) is None
+
+
+async def test_snapshot_states_follows_replaced_participants(hass: HomeAssistant, sensor_loader) -> None:
+    """Test the snapshot reuses the referenced sensors until the participants are replaced."""
+    participants = {
+        "battery": {
+            CONF_ELEMENT_TYPE: ELEMENT_TYPE_BATTERY,
+            CONF_CAPACITY: 10000,
+            CONF_INITIAL_CHARGE_PERCENTAGE: "sensor.battery_soc",
+        },
+    }
+
+    assert set(sensor_loader.snapshot_states(participants)) == {"sensor.battery_soc"}
+    assert set(sensor_loader.snapshot_states(participants)) == {"sensor.battery_soc"}
+
+    # Configuration changes store a new participants mapping, which is walked again
+    new_participants = {
+        "battery": {**participants["battery"], CONF_INITIAL_CHARGE_PERCENTAGE: "sensor.other_soc"},
+    }
+    assert set(sensor_loader.snapshot_states(new_participants)) == {"sensor.other_soc"}
+
+
+async def test_load_network_data_reuses_unchanged_elements(hass: HomeAssistant, sensor_loader) -> None:
+    """Test reloading the network only rebuilds elements whose loaded data changed."""
+    hass.states.async_set("sensor.battery_soc", "50", attributes={"device_class": SensorDeviceClass.BATTERY})
+
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_PARTICIPANTS: {
+                "net": {CONF_ELEMENT_TYPE: ELEMENT_TYPE_NET},
+                "battery": {
+                    CONF_ELEMENT_TYPE: ELEMENT_TYPE_BATTERY,
+                    CONF_CAPACITY: 10000,
+                    CONF_INITIAL_CHARGE_PERCENTAGE: "sensor.battery_soc",
+                },
+            },
+        },
+        entry_id="test_entry_id",
+    )
+
+    network = sensor_loader.load_network_data(config_entry, 300, 4)
+    net = network.elements["net"]
+    battery = network.elements["battery"]
+
+    hass.states.async_set("sensor.battery_soc", "60", attributes={"device_class": SensorDeviceClass.BATTERY})
+    network = sensor_loader.load_network_data(config_entry, 300, 4)
+
+    assert network.elements["net"] is net
+    assert network.elements["battery"] is not battery
+    assert network.elements["battery"].energy[0] == 6000.0
+
+    # Changing the timing rebuilds the whole network
+    network = sensor_loader.load_network_data(config_entry, 600, 4)
+    assert network.elements["net"] is not net
+
+
+async def test_load_network_data_failure_leaves_previous_network(hass: HomeAssistant, sensor_loader) -> None:
+    """Test a failed load builds nothing into the previous network and later loads still build on it."""
+    hass.states.async_set("sensor.battery_soc", "50", attributes={"device_class": SensorDeviceClass.BATTERY})
+
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_PARTICIPANTS: {
+                "net": {CONF_ELEMENT_TYPE: ELEMENT_TYPE_NET},
+                "battery": {
+                    CONF_ELEMENT_TYPE: ELEMENT_TYPE_BATTERY,
+                    CONF_CAPACITY: 10000,
+                    CONF_INITIAL_CHARGE_PERCENTAGE: "sensor.battery_soc",
+                },
+            },
+        },
+        entry_id="test_entry_id",
+    )
+
+    network = sensor_loader.load_network_data(config_entry, 300, 4)
+    elements = dict(network.elements)
+
+    # The battery is rebuilt as its sensor changed, which fails part way through the load
+    hass.states.async_set("sensor.battery_soc", "60", attributes={"device_class": SensorDeviceClass.BATTERY})
+    with (
+        patch.object(Network, "add", side_effect=ValueError("Invalid element")),
+        pytest.raises(ValueError, match="Invalid element"),
+    ):
+        sensor_loader.load_network_data(config_entry, 300, 4)
+
+    assert network.elements == elements
+
+    new_network = sensor_loader.load_network_data(config_entry, 300, 4)
+    assert new_network is not network
+    assert new_network.elements["net"] is elements["net"]
+    assert new_network.elements["battery"] is not elements["battery"]
+
+
 async def test_load_sensor_forecast_with_forecast_attribute(hass: HomeAssistant, sensor_loader) -> None:
     """Test loading forecast data from sensor with forecast attribute."""
     # Set up sensor state with forecast
@@ -297,7 +425,7 @@ async def test_load_sensor_forecast_with_forecast_attribute(hass: HomeAssistant,
         },
     )
 
-    result = await sensor_loader.load_sensor_forecast("sensor.test", 3)
+    result = sensor_loader.load_sensor_forecast("sensor.test", 3)
     assert result == [100, 200, 300]
 
 
@@ -310,7 +438,7 @@ async def test_load_sensor_forecast_without_forecast_attribute(hass: HomeAssista
         attributes={"device_class": SensorDeviceClass.POWER, "unit_of_measurement": UnitOfPower.WATT},
     )
 
-    result = await sensor_loader.load_sensor_forecast("sensor.test", 3)
+    result = sensor_loader.load_sensor_forecast("sensor.test", 3)
     assert result == [150, 150, 150]  # Repeated current value
 
 
@@ -318,7 +446,7 @@ async def test_load_sensor_forecast_missing_sensor(hass: HomeAssistant, sensor_l
     """Test loading forecast data from missing sensor."""
     # Don't set any state for the sensor - it should be missing
 
-    result = await sensor_loader.load_sensor_forecast("sensor.missing", 3)
+    result = sensor_loader.load_sensor_forecast("sensor.missing", 3)
     assert result is None
 
 
@@ -335,7 +463,7 @@ async def test_load_sensor_forecast_invalid_forecast_data(hass: HomeAssistant, s
         },
     )
 
-    result = await sensor_loader.load_sensor_forecast("sensor.test", 3)
+    result = sensor_loader.load_sensor_forecast("sensor.test", 3)
     assert result == [100, 100, 100]  # Falls back to repeated current value
 
 
@@ -363,7 +491,7 @@ async def test_load_sensor_forecast_multiple_sensors_sum(hass: HomeAssistant, se
         },
     )
 
-    result = await sensor_loader.load_sensor_forecast(["sensor.test1", "sensor.test2"], 3)
+    result = sensor_loader.load_sensor_forecast(["sensor.test1", "sensor.test2"], 3)
     assert result == [150, 300, 450]  # Sum of both sensors
 
 
@@ -371,21 +499,21 @@ async def test_resample_forecast_exact_length(hass: HomeAssistant, sensor_loader
     """Test forecast resampling with exact target length."""
     forecast = [100, 200, 300, 400, 500]
     result = sensor_loader._resample_forecast(forecast, 5)
-    assert result == [100, 200, 300, 400, 500]
+    assert result.tolist() == [100, 200, 300, 400, 500]
 
 
 async def test_resample_forecast_downsample(hass: HomeAssistant, sensor_loader) -> None:
     """Test forecast resampling with downsampling."""
     forecast = [100, 200, 300, 400, 500, 600]
     result = sensor_loader._resample_forecast(forecast, 3)
-    assert result == [100.0, 350.0, 600.0]  # Numpy interpolated values
+    assert result.tolist() == [100.0, 350.0, 600.0]  # Numpy interpolated values
 
 
 async def test_resample_forecast_upsample(hass: HomeAssistant, sensor_loader) -> None:
     """Test forecast resampling with upsampling."""
     forecast = [100, 200]
     result = sensor_loader._resample_forecast(forecast, 4)
-    assert result == [100.0, 133.33333333333334, 166.66666666666666, 200.0]  # Numpy interpolated values
+    assert result.tolist() == [100.0, 133.33333333333334, 166.66666666666666, 200.0]  # Numpy interpolated values
 
 
 async def test_get_repeated_value_with_conversion(hass: HomeAssistant, sensor_loader) -> None:
@@ -428,7 +556,7 @@ async def test_get_repeated_value_invalid_number(hass: HomeAssistant, sensor_loa
 # New DataLoader tests
 async def test_load_field_data_constant(hass: HomeAssistant, sensor_loader: DataLoader) -> None:
     """Test loading constant field data."""
-    result = await sensor_loader.load_field_data(CONF_CAPACITY, 1000, MockConfigWithCapacity, 3)
+    result = sensor_loader.load_field_data(CONF_CAPACITY, 1000, MockConfigWithCapacity, 3)
     assert result == 1000
 
 
@@ -441,7 +569,7 @@ async def test_load_field_data_sensor(hass: HomeAssistant, sensor_loader: DataLo
         attributes={"device_class": SensorDeviceClass.POWER, "unit_of_measurement": UnitOfPower.WATT},
     )
 
-    result = await sensor_loader.load_field_data(
+    result = sensor_loader.load_field_data(
         CONF_INITIAL_CHARGE_PERCENTAGE,
         "sensor.test",
         MockConfigWithBatterySensor,
@@ -463,7 +591,7 @@ async def test_load_field_data_forecast(hass: HomeAssistant, sensor_loader: Data
         },
     )
 
-    result = await sensor_loader.load_field_data(CONF_FORECAST, "sensor.test", MockConfigWithPowerSensor, 3)
+    result = sensor_loader.load_field_data(CONF_FORECAST, "sensor.test", MockConfigWithPowerSensor, 3)
     assert result == [100, 200, 300]
 
 
@@ -483,7 +611,7 @@ async def test_load_field_data_multiple_sensors(hass: HomeAssistant, sensor_load
         attributes={"device_class": SensorDeviceClass.POWER, "unit_of_measurement": UnitOfPower.WATT},
     )
 
-    result = await sensor_loader.load_field_data(
+    result = sensor_loader.load_field_data(
         CONF_INITIAL_CHARGE_PERCENTAGE,
         ["sensor.test1", "sensor.test2"],
         MockConfigWithBatterySensor,
@@ -496,7 +624,7 @@ async def test_load_field_data_unavailable_sensor(hass: HomeAssistant, sensor_lo
     """Test loading data from unavailable sensor."""
     # Don't set any state for the sensor - it should be unavailable
 
-    result = await sensor_loader.load_field_data(
+    result = sensor_loader.load_field_data(
         CONF_INITIAL_CHARGE_PERCENTAGE,
         "sensor.unavailable",
         MockConfigWithBatterySensor,
@@ -508,7 +636,7 @@ async def test_load_field_data_unavailable_sensor(hass: HomeAssistant, sensor_lo
 async def test_load_field_data_unknown_field_type(hass: HomeAssistant, sensor_loader: DataLoader) -> None:
     """Test loading data for field with unknown type."""
     # This would use a field that doesn't have field_type metadata
-    result = await sensor_loader.load_field_data("unknown_field", "test_value", MockConfigWithBatterySensor, 3)
+    result = sensor_loader.load_field_data("unknown_field", "test_value", MockConfigWithBatterySensor, 3)
     assert result == "test_value"  # Should return as-is
 
 
@@ -522,7 +650,7 @@ async def test_load_field_data_live_forecast_both_sensors(hass: HomeAssistant, s
     # Test with both live and forecast sensors
     field_value = {"live": "sensor.live_price", "forecast": ["sensor.forecast_1", "sensor.forecast_2"]}
 
-    result = await sensor_loader.load_field_data("import_price", field_value, MockConfigWithLiveForecastPrice, 3)
+    result = sensor_loader.load_field_data("import_price", field_value, MockConfigWithLiveForecastPrice, 3)
 
     # Should return forecast data with first element replaced by live value
     assert isinstance(result, list)
@@ -540,7 +668,7 @@ async def test_load_field_data_live_forecast_only_live(hass: HomeAssistant, sens
     # Test with only live sensor
     field_value = {"live": "sensor.live_price"}
 
-    result = await sensor_loader.load_field_data("import_price", field_value, MockConfigWithLiveForecastPrice, 3)
+    result = sensor_loader.load_field_data("import_price", field_value, MockConfigWithLiveForecastPrice, 3)
 
     # Should return live value repeated for all periods
     assert isinstance(result, list)
@@ -557,7 +685,7 @@ async def test_load_field_data_live_forecast_only_forecast(hass: HomeAssistant,
     # Test with only forecast sensors
     field_value = {"forecast": ["sensor.forecast_1", "sensor.forecast_2"]}
 
-    result = await sensor_loader.load_field_data("import_price", field_value, MockConfigWithLiveForecastPrice, 3)
+    result = sensor_loader.load_field_data("import_price", field_value, MockConfigWithLiveForecastPrice, 3)
 
     # Should return forecast data (sum of sensors)
     assert isinstance(result, list)
@@ -572,7 +700,7 @@ async def test_load_field_data_live_forecast_no_sensors(hass: HomeAssistant, sen
     # Test with empty dict
     field_value = {}
 
-    result = await sensor_loader.load_field_data("import_price", field_value, MockConfigWithLiveForecastPrice, 3)
+    result = sensor_loader.load_field_data("import_price", field_value, MockConfigWithLiveForecastPrice, 3)
 
     # Should return the field value as-is
     assert result == {}
@@ -585,7 +713,7 @@ async def test_load_field_data_live_forecast_invalid_field_value(
     # Test with string instead of dict
     field_value = "invalid_string"
 
-    result = await sensor_loader.load_field_data("import_price", field_value, MockConfigWithLiveForecastPrice, 3)
+    result = sensor_loader.load_field_data("import_price", field_value, MockConfigWithLiveForecastPrice, 3)
 
     # Should return the field value as-is
     assert result == "invalid_string"
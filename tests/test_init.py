@@ -1,9 +1,10 @@
 """Test the HAEO integration."""
 
 from contextlib import suppress
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -134,3 +135,71 @@ async def test_reload_entry(hass: HomeAssistant, mock_config_entry: MockConfigEn
     # The test passes if either the reload works or fails gracefully
     # (the real integration works correctly as shown by successful optimization)
     assert True  # Test passes - real functionality is verified by other tests
+
+
+async def test_reload_entry_unchanged_participants(hass: HomeAssistant, mock_config_entry: MockConfigEntry) -> None:
+    """Test reloading with unchanged participants refreshes the coordinator in place."""
+    mock_config_entry.add_to_hass(hass)
+
+    mock_coordinator = Mock()
+    mock_coordinator.config = {CONF_PARTICIPANTS: mock_config_entry.data[CONF_PARTICIPANTS]}
+    mock_coordinator.async_request_refresh = AsyncMock()
+    mock_config_entry.runtime_data = mock_coordinator
+
+    with patch.object(hass.config_entries, "async_schedule_reload") as mock_reload:
+        await async_reload_entry(hass, mock_config_entry)
+
+    mock_reload.assert_not_called()
+    mock_coordinator.update_config.assert_called_once_with(mock_config_entry)
+    mock_coordinator.async_request_refresh.assert_awaited_once()
+    assert mock_config_entry.runtime_data is mock_coordinator
+
+
+async def test_reload_entry_changed_participants(hass: HomeAssistant, mock_config_entry: MockConfigEntry) -> None:
+    """Test reloading with changed participants schedules a full reload."""
+    mock_config_entry.add_to_hass(hass)
+
+    mock_coordinator = Mock()
+    mock_coordinator.config = {CONF_PARTICIPANTS: {}}
+    mock_coordinator.async_request_refresh = AsyncMock()
+    mock_config_entry.runtime_data = mock_coordinator
+
+    with patch.object(hass.config_entries, "async_schedule_reload") as mock_reload:
+        await async_reload_entry(hass, mock_config_entry)
+
+    mock_reload.assert_called_once_with(mock_config_entry.entry_id)
+    mock_coordinator.update_config.assert_not_called()
+    mock_coordinator.async_request_refresh.assert_not_awaited()
+
+
+async def test_setup_entry_registers_update_listener(hass: HomeAssistant, mock_config_entry: MockConfigEntry) -> None:
+    """Test setup registers async_reload_entry to apply configuration changes."""
+    mock_config_entry.add_to_hass(hass)
+
+    with (
+        patch("custom_components.haeo.HaeoDataUpdateCoordinator", return_value=AsyncMock()),
+        patch.object(hass.config_entries, "async_forward_entry_setups", AsyncMock()),
+    ):
+        assert await async_setup_entry(hass, mock_config_entry) is True
+
+    assert async_reload_entry in mock_config_entry.update_listeners
+
+
+async def test_setup_entry_platform_failure_shuts_down_coordinator(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test a failed platform setup shuts the coordinator down before setup is retried."""
+    mock_config_entry.add_to_hass(hass)
+    mock_coordinator = AsyncMock()
+
+    with (
+        patch("custom_components.haeo.HaeoDataUpdateCoordinator", return_value=mock_coordinator),
+        patch.object(
+            hass.config_entries, "async_forward_entry_setups", AsyncMock(side_effect=Exception("Platform failed"))
+        ),
+        pytest.raises(ConfigEntryNotReady),
+    ):
+        await async_setup_entry(hass, mock_config_entry)
+
+    mock_coordinator.async_shutdown.assert_awaited_once()
+    assert mock_config_entry.runtime_data is None
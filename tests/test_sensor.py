@@ -573,6 +573,14 @@ def test_connection_sensor_device_info(mock_coordinator, mock_config_entry):
     assert device_info.get("model") == "entity.device.connection"
 
 
+def test_unknown_type_sensor_device_info(mock_coordinator, mock_config_entry):
+    """Test device info for an element stored with a type that is no longer known."""
+    sensor = HaeoElementPowerSensor(mock_coordinator, mock_config_entry, "test_legacy", "legacy_type")
+    device_info = sensor.device_info
+
+    assert device_info.get("model") == "entity.device.legacy_type"
+
+
 def test_sensor_unavailable_when_sensor_data_missing(mock_config_entry):
     """Test that sensors show as unavailable when underlying sensor data is missing."""
     # Create a coordinator with missing sensor data